@@ -1,13 +1,13 @@
 """This module provides the RP To-Do CLI."""
 # rptodo/cli.py
 
-from typing import Optional
+from typing import List, Optional
 
 import typer
 import os
 
 
-from ddgen import __app_name__, __version__, dbc2sldd, slddgen
+from ddgen import __app_name__, __version__, dbc2sldd, pars2sldd, slddgen, ddindex, emitters, slddexport, validate, slddzip
 
 app = typer.Typer()
 
@@ -16,6 +16,16 @@ def _version_callback(value: bool) -> None:
         typer.echo(f"{__app_name__} v{__version__}")
         raise typer.Exit()
 
+def _compression_callback(value: Optional[str]) -> Optional[str]:
+    if value is not None and value not in slddzip.COMPRESSION:
+        raise typer.BadParameter(f"'{value}', choose from {', '.join(slddzip.COMPRESSION)}")
+    return value
+
+def _split_callback(value: Optional[str]) -> Optional[str]:
+    if value is not None and value != "node":
+        raise typer.BadParameter(f"'{value}', only 'node' is supported; configure message-name patterns in generate.yml")
+    return value
+
 @app.callback()
 def main(
     version: Optional[bool] = typer.Option(
@@ -51,6 +61,52 @@ def delete(
 @app.command()
 def dbc(
     dbcpath: str,
+    split: Optional[str] = typer.Option(
+        None,
+        "--split",
+        callback=_split_callback,
+        help="Split into referenced sub-dictionaries by 'node' (transmitting node). "
+             "Message-name patterns are configured with 'split' in generate.yml.",
+    ),
+    range_types: Optional[bool] = typer.Option(
+        None,
+        "--range-types/--no-range-types",
+        help="Pick the narrowest signal data types from the physical signal range.",
+    ),
+    fixdt: Optional[str] = typer.Option(
+        None,
+        "--fixdt",
+        help="Use fixed-point types for scaled signals: 'exact' or 'approx' (power-of-two slopes). "
+             "Per-message scaling is configured with 'fixdt' in generate.yml.",
+    ),
+    pack_buses: Optional[bool] = typer.Option(
+        None,
+        "--pack-buses/--no-pack-buses",
+        help="Order bus elements to minimize struct padding and report the size savings.",
+    ),
+    target: List[str] = typer.Option(
+        ["sldd"],
+        "--target",
+        "-t",
+        help=f"Outputs to write from the parsed DBC, repeatable: {', '.join(emitters.EMITTERS)}.",
+    ),
+    validate_only: bool = typer.Option(
+        False,
+        "--validate-only",
+        help="Only check the parsed model and report all errors, write nothing.",
+    ),
+    compression: Optional[str] = typer.Option(
+        None,
+        "--compression",
+        callback=_compression_callback,
+        help=f"Archive compression of the .sldd: {', '.join(slddzip.COMPRESSION)}. "
+             "Defaults to 'compression' in generate.yml, else default. Reports the archive size and time.",
+    ),
+    chunk_size: Optional[int] = typer.Option(
+        None,
+        "--chunk-size",
+        help="Maximum number of objects per .sldd chunk file, chunks are compressed in parallel.",
+    ),
     # force: bool = typer.Option(
     #     ...,
     #     prompt=f"Are you sure you want to generate sldd?",
@@ -65,6 +121,146 @@ def dbc(
     dbcname = os.path.basename(dbcpath)
     # if force:
     print(f"Generating sldd for: {dbcname}")
-    dbc2sldd.dbc2sldd_gen(dbcpath)
+    try:
+        errors = dbc2sldd.dbc2sldd_gen(dbcpath, split=split, range_types=range_types, fixdt=fixdt,
+                                       pack_buses=pack_buses, targets=target, validate_only=validate_only,
+                                       compression=compression, chunk_size=chunk_size)
+    except validate.ValidationError:
+        raise typer.Exit(1)
+    except ValueError as e:
+        # Invalid options, also from generate.yml
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+    if errors:
+        raise typer.Exit(1)
     # else:
-    #     print("Operation cancelled")
\ No newline at end of file
+    #     print("Operation cancelled")
+
+@app.command()
+def params(
+    xlspath: str,
+    par_type: str = typer.Option(
+        "import_from_file",
+        "--par-type",
+        help="Parameter class and storage class preset: import_from_file or eco.",
+    ),
+    split_by_sheet: bool = typer.Option(
+        False,
+        "--split-by-sheet",
+        help="Write every sheet to its own sub-dictionary.",
+    ),
+    target: List[str] = typer.Option(
+        ["sldd"],
+        "--target",
+        "-t",
+        help=f"Outputs to write from the parameters, repeatable: {', '.join(emitters.EMITTERS)}.",
+    ),
+    validate_only: bool = typer.Option(
+        False,
+        "--validate-only",
+        help="Only check the parameters and report all errors, write nothing.",
+    ),
+    compression: str = typer.Option(
+        "default",
+        "--compression",
+        callback=_compression_callback,
+        help=f"Archive compression of the .sldd: {', '.join(slddzip.COMPRESSION)}. "
+             "Reports the archive size and time.",
+    ),
+    chunk_size: Optional[int] = typer.Option(
+        None,
+        "--chunk-size",
+        help="Maximum number of objects per .sldd chunk file, chunks are compressed in parallel.",
+    ),
+):
+    """
+    Generate a Simulink Data Dictionary from a parameters workbook.
+    """
+    print(f"Generating sldd for: {os.path.basename(xlspath)}")
+    try:
+        errors = pars2sldd.pars2sldd_gen(xlspath, par_type, split_by_sheet=split_by_sheet, targets=target,
+                                         validate_only=validate_only, compression=compression, chunk_size=chunk_size)
+    except validate.ValidationError:
+        raise typer.Exit(1)
+    except ValueError as e:
+        # Invalid options, also from generate.yml
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+    if errors:
+        raise typer.Exit(1)
+
+@app.command()
+def dbcs(
+    dbcpaths: List[str],
+    common: Optional[str] = typer.Option(
+        None,
+        "--common",
+        help="Path of the common dictionary, defaults to common.sldd next to the first DBC file.",
+    ),
+    compression: str = typer.Option(
+        "default",
+        "--compression",
+        callback=_compression_callback,
+        help=f"Archive compression of the .sldd files: {', '.join(slddzip.COMPRESSION)}.",
+    ),
+):
+    """
+    Generate Simulink Data Dictionaries from several DBC files.
+
+    Buses and enums shared by several DBC files go to one common dictionary
+    referenced by the per-DBC dictionaries.
+    """
+    print(f"Generating sldd for: {', '.join(os.path.basename(p) for p in dbcpaths)}")
+    try:
+        dbc2sldd.dbcs2sldd_gen(dbcpaths, common, compression)
+    except validate.ValidationError:
+        raise typer.Exit(1)
+    except ValueError as e:
+        # Invalid options, also from generate.yml
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+
+
+@app.command()
+def index(
+    paths: List[str],
+    db: str = typer.Option(ddindex.INDEX_FILE, "--db", help="Path to the SQLite index."),
+):
+    """
+    Index the .sldd and .dbc files found in PATHS into a SQLite symbol index.
+
+    Only new or changed files are parsed again.
+    """
+    indexed, unchanged, removed = ddindex.update_index(paths, db)
+    print(f"Indexed {indexed} files, {unchanged} unchanged, {removed} removed. Index: {db}")
+
+@app.command()
+def query(
+    pattern: str,
+    db: str = typer.Option(ddindex.INDEX_FILE, "--db", help="Path to the SQLite index."),
+    kind: Optional[str] = typer.Option(
+        None, "--kind", help="Only show one kind: bus, enum, param, type, signal, enum value."
+    ),
+):
+    """
+    Find which dictionaries define a name or glob PATTERN (e.g. 'EC1_*').
+    """
+    rows = ddindex.query_index(pattern, db, kind)
+    for row_kind, name, datatype, parent, path in rows:
+        location = f"{parent}." if parent else ""
+        print(f"{row_kind:10} {location}{name} [{datatype}] {path}")
+    if not rows:
+        print(f"No match for '{pattern}'")
+
+
+@app.command()
+def export(
+    slddpath: str,
+    fmt: str = typer.Option("csv", "--format", "-f", help="Output format: csv or parquet (needs pyarrow)."),
+    out: Optional[str] = typer.Option(None, "--out", "-o", help="Output directory, defaults to the dictionary directory."),
+):
+    """
+    Export parameters, bus elements and enum values of a dictionary as tables.
+    """
+    for path in slddexport.export_sldd(slddpath, out, fmt):
+        print(f"path:{path}")
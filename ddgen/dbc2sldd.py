@@ -2,9 +2,13 @@ import os
 from canmatrix import canmatrix
 import sys
 import yaml
+import hashlib
+import math
+import re
+import numpy as np
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # Adjust path as needed
-from ddgen import slddgen
+from ddgen import slddgen, symbols, layout, emitters, validate, slddzip
 
 def propose_data_type(signal):
     """
@@ -56,21 +60,213 @@ def propose_data_type(signal):
             else:
                 return "uint64"
             
-def create_bus_entries_from_dbc(dbc_file,conf=None):
+# Integer types from narrowest to widest, unsigned first at each width
+INT_TYPE_RANGES = [
+    ("uint8", 0, 2**8 - 1), ("int8", -2**7, 2**7 - 1),
+    ("uint16", 0, 2**16 - 1), ("int16", -2**15, 2**15 - 1),
+    ("uint32", 0, 2**32 - 1), ("int32", -2**31, 2**31 - 1),
+    ("uint64", 0, 2**64 - 1), ("int64", -2**63, 2**63 - 1),
+]
+
+def signal_ranges(signals):
+    """
+    Compute the physical range of CAN signals, vectorized over all signals.
+    
+    The range of the raw value (bit length, signedness) is scaled with factor and offset
+    and narrowed to the DBC min/max when those are set (min == max == 0 means unset).
+    
+    Args:
+        signals (list): canmatrix Signal objects.
+    
+    Returns:
+        tuple: NumPy arrays (phys_min, phys_max, is_integral); is_integral is True where
+            factor and offset are integers, so every physical value is an integer.
+    """
+    def to_array(attr, default):
+        return np.array([float(getattr(s, attr)) if getattr(s, attr) is not None else default for s in signals],
+                        dtype=float)
+    size = np.array([s.size for s in signals], dtype=float)
+    signed = np.array([bool(s.is_signed) for s in signals])
+    factor = to_array("factor", 1.0)
+    offset = to_array("offset", 0.0)
+    dbc_min = to_array("min", 0.0)
+    dbc_max = to_array("max", 0.0)
+
+    raw_min = np.where(signed, -np.exp2(size - 1), 0.0)
+    raw_max = np.where(signed, np.exp2(size - 1) - 1, np.exp2(size) - 1)
+    scaled_a = raw_min * factor + offset
+    scaled_b = raw_max * factor + offset
+    phys_min = np.minimum(scaled_a, scaled_b)
+    phys_max = np.maximum(scaled_a, scaled_b)
+    has_limits = dbc_max > dbc_min
+    phys_min = np.where(has_limits, np.maximum(phys_min, dbc_min), phys_min)
+    phys_max = np.where(has_limits, np.minimum(phys_max, dbc_max), phys_max)
+    is_integral = (factor == np.round(factor)) & (offset == np.round(offset))
+    return phys_min, phys_max, is_integral
+
+def propose_data_types_by_range(signals):
+    """
+    Propose the narrowest Simulink data types for CAN signals from their physical range.
+    
+    Signals with integer factor and offset get the narrowest integer type holding their
+    range; other scaled signals keep the floating-point type of propose_data_type.
+    
+    Args:
+        signals (list): canmatrix Signal objects, typically all signals of a network.
+    
+    Returns:
+        list: Proposed Simulink data types, in the order of signals.
+    """
+    if not signals:
+        return []
+    phys_min, phys_max, is_integral = signal_ranges(signals)
+    # fits[i, j]: signal j fits into INT_TYPE_RANGES[i]
+    fits = np.array([(phys_min >= t_min) & (phys_max <= t_max) for _, t_min, t_max in INT_TYPE_RANGES])
+    first_fit = np.argmax(fits, axis=0)
+    any_fit = fits.any(axis=0)
+    data_types = []
+    for j, signal in enumerate(signals):
+        if signal.size == 1:
+            data_types.append("boolean")
+        elif is_integral[j] and any_fit[j]:
+            data_types.append(INT_TYPE_RANGES[first_fit[j]][0])
+        else:
+            data_types.append(propose_data_type(signal))
+    return data_types
+
+FIXDT_SCALINGS = ("exact", "approx")
+FIXDT_PATTERN = re.compile(r"fixdt\(([^)]*)\)")
+
+def propose_fixdt(signal, scaling="exact"):
+    """
+    Propose a Simulink fixed-point data type for a scaled CAN signal.
+    
+    Args:
+        signal: canmatrix Signal object.
+        scaling (str): 'exact' uses the DBC factor and offset as slope and bias.
+            'approx' rounds the slope up to a power of two, so the generated code rescales
+            with shifts instead of multiplications; the word length stays the same and the
+            resolution is at most two times coarser than the DBC factor.
+    
+    Returns:
+        str: fixdt(...) expression, None if the signal has no fixed-point representation.
+    """
+    factor = float(signal.factor) if signal.factor is not None else 1.0
+    offset = float(signal.offset) if signal.offset is not None else 0.0
+    if factor <= 0:
+        return None
+    slope = factor
+    if scaling == "approx":
+        slope = 2.0 ** math.ceil(math.log2(factor))
+    word_length = next((wl for wl in (8, 16, 32, 64) if signal.size <= wl), None)
+    if word_length is None:
+        return None
+    signed = int(bool(signal.is_signed))
+    exponent = math.log2(slope)
+    if offset == 0 and exponent == int(exponent):
+        return f"fixdt({signed},{word_length},{-int(exponent)})"
+    return f"fixdt({signed},{word_length},{slope!r},{offset!r})"
+
+def fixdt_scaling(fixdt, message_name):
+    """Fixed-point scaling for a message: fixdt is a scaling name or {message_name: scaling, 'default': scaling}."""
+    if isinstance(fixdt, dict):
+        return fixdt.get(message_name, fixdt.get("default"))
+    return fixdt
+
+def extract_numeric_types(bus_entries):
+    """
+    Replace inline fixdt(...) bus element types by named Simulink.NumericType entries.
+    
+    Names follow the Simulink convention (sfix16_En4, ufix16_S0p1_Bn40), so identical
+    types share one entry.
+    
+    Args:
+        bus_entries (list): Tuples (bus_name, elements), updated in place.
+    
+    Returns:
+        list: Dictionaries {type_name: type_dict} for slddgen.create_simulink_dd.
+    """
+    def num(v):
+        return repr(v).replace(".", "p").replace("-", "n").replace("+", "")
+    numeric_types = {}
+    for _, elements in bus_entries:
+        for el in elements:
+            match = FIXDT_PATTERN.fullmatch(el["DataType"])
+            if not match:
+                continue
+            args = [float(a) for a in match.group(1).split(",")]
+            prefix = ("s" if args[0] else "u") + f"fix{int(args[1])}"
+            if len(args) == 3:
+                fraction_length = int(args[2])
+                type_name = f"{prefix}_En{fraction_length}" if fraction_length >= 0 else f"{prefix}_E{-fraction_length}"
+                slope, bias = 2.0 ** -fraction_length, 0.0
+            else:
+                slope, bias = args[2], args[3]
+                type_name = symbols.make_c_compatible(f"{prefix}_S{num(slope)}_B{num(bias)}")
+            numeric_types.setdefault(type_name, {
+                "Signed": bool(args[0]),
+                "WordLength": int(args[1]),
+                "Slope": slope,
+                "Bias": bias,
+                "Description": el["DataType"],
+            })
+            el["DataType"] = type_name
+    return [{type_name: type_dict} for type_name, type_dict in numeric_types.items()]
+
+def load_generate_conf(dbc_file):
+    """Load generate.yml located next to the DBC file, None if there is none."""
+    conf_file= os.path.join(os.path.dirname(dbc_file), "generate.yml")
+    conf=None
+    if os.path.exists(conf_file):
+        with open(conf_file, 'r') as file:
+            conf = yaml.safe_load(file)
+    return conf
+
+def get_dbc_conf(conf, dbc_name):
+    """
+    Get the generate.yml section of one DBC file.
+    generate.yml is either a mapping or a list of mappings keyed by DBC file name.
+    """
+    if isinstance(conf, list):
+        conf = {k: v for d in conf for k, v in d.items()}
+    if conf and dbc_name in conf:
+        return conf[dbc_name]
+    return None
+
+def table_key(enum_table):
+    """Hashable key of a value table, used to find enums with identical content."""
+    return tuple(sorted(enum_table.items()))
+
+def create_bus_entries_from_dbc(dbc_file,conf=None,symbol_table=None,range_types=None,fixdt=None,bus_messages=None):
     """
     Read a DBC file and create Simulink Data Dictionary buses and enums for each CAN message.
     Args:
         dbc_file (str): Path to the input DBC file.
+        symbol_table (symbols.SymbolTable, optional): Table the bus and enum names are registered in.
+            Names colliding with existing symbols or reserved words are renamed, see symbol_table.collisions.
+        range_types (bool, optional): Pick the narrowest type from the signal range, see propose_data_types_by_range.
+            Defaults to the 'range_types' key of the DBC section in generate.yml.
+        fixdt (optional): Use fixed-point types instead of single/double for scaled signals: 'exact', 'approx'
+            or {message_name: scaling, 'default': scaling}, see propose_fixdt. The element types are inline
+            fixdt(...) expressions, see extract_numeric_types. Defaults to the 'fixdt' key in generate.yml.
+        bus_messages (dict, optional): Filled with {bus_name: (message_name, transmitters)}, so buses can be
+            traced back to their message after the symbol table renamed them, see group_bus_entries.
     Returns:
         tuple: (bus_entries, EnumsExport)
     """
+    if symbol_table is None:
+        symbol_table = symbols.SymbolTable()
     db = canmatrix.formats.loadp_flat(str(dbc_file))
     dbc_name = os.path.basename(dbc_file)
-    if conf:
-        if dbc_name in conf:
-            conf=conf[dbc_name]
-        else:
-            conf=None
+    conf=get_dbc_conf(conf, dbc_name)
+    if range_types is None:
+        range_types = bool(conf and conf.get('range_types'))
+    if fixdt is None and conf:
+        fixdt = conf.get('fixdt')
+    scalings = fixdt.values() if isinstance(fixdt, dict) else [fixdt] if fixdt else []
+    unknown = [scaling for scaling in scalings if scaling not in FIXDT_SCALINGS]
+    if unknown:
+        raise ValueError(f"Unknown fixdt scaling: {', '.join(map(str, unknown))}. Available: {', '.join(FIXDT_SCALINGS)}")
             
     bus_entries = []
     EnumsExport = []
@@ -82,21 +278,21 @@ def create_bus_entries_from_dbc(dbc_file,conf=None):
         new_enum_name=enum_name
         if not enum_name.endswith('_enum'):
             new_enum_name = enum_name + '_enum'
-        if conf['enum_prefix'] and not new_enum_name.startswith(conf['enum_prefix'] ): 
+        if conf and conf.get('enum_prefix') and not new_enum_name.startswith(conf['enum_prefix'] ): 
             new_enum_name = conf['enum_prefix'] +new_enum_name
         return new_enum_name
         
         
-    enum_names=list(db_enums.keys())
-    for enum_name in enum_names:
+    # Register enum names in the symbol table and index them by content,
+    # so a signal's value table is found with one hash lookup
+    enum_by_table = {}
+    renamed_enums = {}
+    for enum_name, enum_table in db_enums.items():
         # Ensure enum name ends with _enum
-        new_enum_name=enum_name_proc(enum_name)
-        # if not enum_name.endswith('_enum'):
-        #     new_enum_name = enum_name + '_enum'
-        # if conf['enum_prefix'] and not new_enum_name.startswith(conf['enum_prefix'] ): 
-        #     new_enum_name = conf['enum_prefix'] +new_enum_name
-        if not (new_enum_name == enum_name):
-            db_enums[new_enum_name] = db_enums.pop(enum_name)
+        new_enum_name=symbol_table.add(enum_name_proc(enum_name), "enum")
+        renamed_enums[new_enum_name] = enum_table
+        enum_by_table.setdefault(table_key(enum_table), new_enum_name)
+    db_enums = renamed_enums
                 
     element_avl_dict = {
                 "Name": "IsMsgAvl",
@@ -105,65 +301,49 @@ def create_bus_entries_from_dbc(dbc_file,conf=None):
                 "Description": "Is Message Available",
                 "Units": ""
             }
-        # Helper to check if enum already exported
-    def enum_in_export(enum_name):
-        return any(enum_name in d for d in EnumsExport)
-    import re
-    def make_c_compatible(name):
-        # Replace any non-alphanumeric or underscore with underscore
-        new_enum_name=re.sub(r'[^a-zA-Z0-9_]', '_', name)
-        if new_enum_name.startswith(('0','1','2','3','4','5','6','7','8','9')):
-            new_enum_name='E_'+new_enum_name    
-        return new_enum_name
+    exported = set()
+
+    range_data_types = {}
+    if range_types:
+        # One vectorized pass over all non-enum signals of the network
+        signals = [signal for message in db.frames for signal in message.signals
+                   if not (isinstance(signal.values, dict) and signal.values)]
+        range_data_types = dict(zip(map(id, signals), propose_data_types_by_range(signals)))
 
     for message in db.frames:
         # Prepare signal elements for the message
         if message.name.startswith("VECTOR__INDEPENDENT_SIG"):
             # Skip messages that are not relevant for Simulink
             continue
-        if conf and conf['msgs']:
+        if conf and conf.get('msgs'):
             if message.name not in conf['msgs']:
                 continue
             
         elements = []
+        bus_symbols = symbols.SymbolTable()
         for signal in message.signals:
             # Check for enumeration
-            enum_type = None
-            enum_dict = None
             is_enum = isinstance(signal.values, dict) and bool(signal.values)
-            # If signal.values matches a db_enums entry
             if is_enum:
-                for enum_name, enum_table in db_enums.items():
-                    if signal.values == enum_table:
-                        # Ensure enum name ends with _enum
-                        # if not enum_name.endswith('_enum'):
-                        #     new_enum_name = enum_name + '_enum'
-                        #     db_enums[new_enum_name] = db_enums.pop(enum_name)
-                        #     enum_name = new_enum_name
-                        #     enum_table = db_enums[enum_name]
-                        enum_type = enum_name
-                        enum_dict = enum_table
-                        
-                        break
-                if enum_type:
-                    # Use Enum: EnumName
-                    data_type = f"Enum: {enum_type}"
-                    # Export enum if not already
-                    if not enum_in_export(enum_type):
-                        EnumsExport.append({enum_type: enum_dict})
-                elif signal.values:
-                    # Create new enum for this signal
-                    # enum_type = signal.name + "_enum"
-                    enum_type=enum_name_proc(signal.name)
-                    enum_dict = signal.values
-                    data_type = f"Enum: {enum_type}"
-                    db_enums[enum_type] = enum_dict
-                    if not enum_in_export(enum_type):
-                        EnumsExport.append({enum_type: enum_dict})
+                # If signal.values matches a db_enums entry use it, else create a new enum for this signal
+                key = table_key(signal.values)
+                enum_type = enum_by_table.get(key)
+                if enum_type is None:
+                    enum_type = symbol_table.add(enum_name_proc(signal.name), "enum")
+                    db_enums[enum_type] = signal.values
+                    enum_by_table[key] = enum_type
+                # Use Enum: EnumName
+                data_type = f"Enum: {enum_type}"
+                # Export enum if not already
+                if enum_type not in exported:
+                    exported.add(enum_type)
+                    EnumsExport.append({enum_type: db_enums[enum_type]})
             else:
-                data_type = propose_data_type(signal)
+                data_type = range_data_types.get(id(signal)) or propose_data_type(signal)
+                if data_type in ("single", "double") and fixdt_scaling(fixdt, message.name) in FIXDT_SCALINGS:
+                    data_type = propose_fixdt(signal, fixdt_scaling(fixdt, message.name)) or data_type
             element_dict = {
-                "Name": signal.name,
+                "Name": bus_symbols.add(signal.name, "signal"),
                 "DataType": data_type,
                 "IsEnum": is_enum,
                 "Dimensions": 1,
@@ -174,25 +354,24 @@ def create_bus_entries_from_dbc(dbc_file,conf=None):
         # sort elements by name
         elements.sort(key=lambda x: x["Name"])
         # Add availability signal at the start
-        if not any(el["Name"] == "IsMsgAvl" for el in elements):
+        if "IsMsgAvl" not in bus_symbols:
             # Ensure availability signal is present
             elements.insert(0, element_avl_dict)  # Insert availability signal at the start
         # Create bus for the message
-        bus_name ="CAN_MSG_"+message.name+"_t"
+        bus_name =symbol_table.add("CAN_MSG_"+message.name+"_t", "bus")
         # bus_element = create_simulink_bus(bus_name, elements)
         bus_entries.append((bus_name, elements))
+        if bus_messages is not None:
+            bus_messages[bus_name] = (message.name, list(message.transmitters))
+        symbol_table.collisions += [(kind, f"{bus_name}.{name}", f"{bus_name}.{resolved}", reason)
+                                    for kind, name, resolved, reason in bus_symbols.collisions]
 
     # Post-process EnumsExport for C compatibility
     for enum in EnumsExport:
         for enum_name, enum_table in enum.items():
-            # Ensure enum name ends with _enum
-            if not enum_name.endswith('_enum'):
-                new_enum_name = enum_name + '_enum'
-                enum[new_enum_name] = enum.pop(enum_name)
-                enum_name = new_enum_name
-                enum_table = enum[enum_name]
             # Replace C-incompatible symbols in enum value names
-            for k in list(enum_table.keys()):
+            enum_symbols = symbols.SymbolTable()
+            for k in sorted(enum_table.keys()):
                 v = enum_table[k]
                 if v is None  or (v and (v == '' or v.isspace() or  v.startswith("Description for the value"))):
                     v1 = f"VALUE_{k}"
@@ -200,9 +379,11 @@ def create_bus_entries_from_dbc(dbc_file,conf=None):
                     v1=v
                 # v1 = v if v and not v.startswith("Description for the value") else f"VALUE_{k}"
                 
-                new_v = make_c_compatible(v1) if isinstance(v1, str) else v1
+                new_v = enum_symbols.add(v1, "enum value") if isinstance(v1, str) else v1
                 if new_v != v:
                     enum_table[k] = new_v
+            symbol_table.collisions += [(kind, f"{enum_name}.{name}", f"{enum_name}.{resolved}", reason)
+                                        for kind, name, resolved, reason in enum_symbols.collisions]
     return bus_entries, EnumsExport
 
 # def bus_entries_preproc():
@@ -225,31 +406,222 @@ def create_bus_entries_from_dbc(dbc_file,conf=None):
 #                 raise ValueError(f"Element {element} in bus {bus_name} is missing required keys.")
         
 #     return bus_entries
-def dbc2sldd_gen(dbc_file,conf=None):
+def group_bus_entries(bus_entries, split, bus_messages):
+    """
+    Group bus entries for sub-dictionaries.
+    
+    Args:
+        bus_entries (list): Tuples (bus_name, elements).
+        split: "node" to group by transmitting node, or a dictionary {group_name: message_name_regex}
+            (first matching pattern wins). Unmatched messages go to group "other".
+        bus_messages (dict): {bus_name: (message_name, transmitters)}, see create_bus_entries_from_dbc.
+    
+    Returns:
+        dict: {group_name: bus_entries}
+    """
+    if split == "node":
+        def group_of(bus_name):
+            _, transmitters = bus_messages.get(bus_name, ("", []))
+            return "_".join(transmitters) or "other"
+    elif isinstance(split, dict):
+        patterns = [(group_name, re.compile(pattern)) for group_name, pattern in split.items()]
+        def group_of(bus_name):
+            msg_name, _ = bus_messages.get(bus_name, ("", []))
+            return next((group_name for group_name, pattern in patterns if pattern.match(msg_name)), "other")
+    else:
+        raise ValueError(f"Unknown split mode: {split}")
+    groups = {}
+    for bus_name, elements in bus_entries:
+        groups.setdefault(group_of(bus_name), []).append((bus_name, elements))
+    return groups
+
+def dbc2sldd_gen(dbc_file,conf=None,split=None,range_types=None,fixdt=None,pack_buses=None,targets=("sldd",),
+                 validate_only=False,compression=None,chunk_size=None):
     """
     Generate a Simulink Data Dictionary from a DBC file.
     
     This function reads a DBC file, extracts CAN messages and their signals,
     and creates a Simulink Data Dictionary with buses for each message.
     
+    Args:
+        dbc_file (str): Path to the input DBC file.
+        split (optional): Split the output into referenced sub-dictionaries, see group_bus_entries.
+            Defaults to the 'split' key of the DBC section in generate.yml.
+        range_types (bool, optional): Pick signal types from their physical range, see create_bus_entries_from_dbc.
+        fixdt (optional): Fixed-point types for scaled signals, see create_bus_entries_from_dbc.
+        pack_buses (bool, optional): Order bus elements to minimize the C struct size and write the bus alignment,
+            see layout.pack_bus_entries. Defaults to the 'pack_buses' key of the DBC section in generate.yml.
+        targets (iterable): Outputs written next to the DBC file from the same parsed model, see emitters.EMITTERS.
+        validate_only (bool): Only validate the model, see validate.validate_model, and write nothing.
+        compression (str, optional): .sldd archive compression (stored, fast, default, best), see
+            slddgen.create_simulink_dd. Defaults to the 'compression' key of the DBC section in generate.yml.
+        chunk_size (int, optional): Maximum number of objects per .sldd chunk, chunks are compressed in parallel.
+            Defaults to the 'chunk_size' key of the DBC section in generate.yml.
+    
     Returns:
-        None
+        list: Validation errors (empty when the outputs were written).
+    
+    Raises:
+        validate.ValidationError: If validation fails and validate_only is False.
     """
     # Example DBC file path (replace with actual path)
     # dbc_file = "example.dbc"
     sldd_name= os.path.splitext(os.path.basename(dbc_file))[0] + ".sldd"
     sldd_path = os.path.join(os.path.dirname(dbc_file), sldd_name)
-    conf_file= os.path.join(os.path.dirname(dbc_file), "generate.yml")
-    conf=None
-    if os.path.exists(conf_file):
-        with open(conf_file, 'r') as file:
-            conf = yaml.safe_load(file)
+    conf=load_generate_conf(dbc_file)
+    dbc_conf = get_dbc_conf(conf, os.path.basename(dbc_file)) or {}
+    sldd_options = {"compression": compression or dbc_conf.get('compression', "default"),
+                    "chunk_size": chunk_size or dbc_conf.get('chunk_size')}
+    slddzip.check_compression(sldd_options["compression"])
 
     # Create Simulink Data Dictionary from DBC
-    bus_entries, enums_entries =create_bus_entries_from_dbc(dbc_file,conf)
+    symbol_table = symbols.SymbolTable()
+    bus_messages = {}
+    bus_entries, enums_entries =create_bus_entries_from_dbc(dbc_file,conf,symbol_table,range_types,fixdt,bus_messages)
+    numeric_type_entries = extract_numeric_types(bus_entries)
+    if pack_buses is None:
+        pack_buses = bool(dbc_conf.get('pack_buses'))
+    bus_alignments = {}
+    if pack_buses:
+        bus_entries, bus_alignments, report = layout.pack_bus_entries(bus_entries)
+        layout.print_layout_report(report)
+    for line in symbol_table.report(os.path.basename(dbc_file)):
+        print(line)
     print([msg for (msg,_) in bus_entries])
-    slddgen.create_simulink_dd(sldd_path,bus_entries=bus_entries,enum_entries=enums_entries)
-    print(f"\nSimulink Data Dictionary '{sldd_name}' created successfully from DBC file.\npath:{sldd_path}")
+    if split is None:
+        split = dbc_conf.get('split')
+    groups = None
+    if split:
+        groups = {group_name: ([], buses) for group_name, buses in group_bus_entries(bus_entries, split, bus_messages).items()}
+    model = emitters.new_model(buses=bus_entries, enums=enums_entries, numeric_types=numeric_type_entries,
+                               bus_alignments=bus_alignments, groups=groups)
+    errors = validate.validate_model(model)
+    validate.print_report(errors, os.path.basename(dbc_file))
+    if validate_only:
+        return errors
+    if errors:
+        raise validate.ValidationError(errors)
+    output_files = emitters.emit_all(os.path.splitext(sldd_path)[0], model, targets, sldd_options)
+    print(f"\nCreated successfully from DBC file:\n" + "\n".join(f"path:{f}" for f in output_files))
+    return errors
+
+def entry_hash(value):
+    """Content hash used to find identical buses and enums in different DBC files."""
+    return hashlib.sha1(repr(value).encode("utf-8")).hexdigest()
+
+def bus_hash(elements):
+    return entry_hash([(el["Name"], el["DataType"], el["Dimensions"], el.get("Description", ""), el.get("Units", ""))
+                       for el in elements])
+
+def enum_hash(enum_table):
+    return entry_hash(sorted(enum_table.items()))
+
+def split_shared_entries(dbc_entries):
+    """
+    Move buses and enums defined identically in two or more DBC files into a common set.
+    
+    Args:
+        dbc_entries (dict): {dbc_file: (bus_entries, enum_entries)} as returned by create_bus_entries_from_dbc.
+    
+    Returns:
+        tuple: (common_bus_entries, common_enum_entries, unique_entries, conflicts)
+            unique_entries has the layout of dbc_entries without the shared entries,
+            conflicts is a list of (kind, name, {hash: [dbc_file, ...]}) for names defined with different content.
+    """
+    enum_seen = {}  # name -> {hash: [dbc_file, ...]}
+    enum_values = {}
+    bus_seen = {}
+    bus_values = {}
+    for dbc_file, (bus_entries, enum_entries) in dbc_entries.items():
+        for enum in enum_entries:
+            for enum_name, enum_table in enum.items():
+                enum_seen.setdefault(enum_name, {}).setdefault(enum_hash(enum_table), []).append(dbc_file)
+                enum_values.setdefault(enum_name, enum_table)
+        for bus_name, elements in bus_entries:
+            bus_seen.setdefault(bus_name, {}).setdefault(bus_hash(elements), []).append(dbc_file)
+            bus_values.setdefault(bus_name, elements)
+
+    def is_shared(hashes):
+        return len(hashes) == 1 and len(next(iter(hashes.values()))) > 1
+
+    shared_enums = {name for name, hashes in enum_seen.items() if is_shared(hashes)}
+    # A bus can only move to the common dictionary together with the enums it uses
+    shared_buses = {name for name, hashes in bus_seen.items()
+                    if is_shared(hashes) and all(el["DataType"][len("Enum: "):] in shared_enums
+                                                 for el in bus_values[name] if el["DataType"].startswith("Enum: "))}
+    conflicts = [("enum", name, hashes) for name, hashes in enum_seen.items() if len(hashes) > 1]
+    conflicts += [("bus", name, hashes) for name, hashes in bus_seen.items() if len(hashes) > 1]
+
+    common_bus_entries = [(name, bus_values[name]) for name in bus_values if name in shared_buses]
+    common_enum_entries = [{name: enum_values[name]} for name in enum_values if name in shared_enums]
+    unique_entries = {}
+    for dbc_file, (bus_entries, enum_entries) in dbc_entries.items():
+        unique_entries[dbc_file] = (
+            [(name, elements) for name, elements in bus_entries if name not in shared_buses],
+            [enum for enum in enum_entries if not any(name in shared_enums for name in enum)],
+        )
+    return common_bus_entries, common_enum_entries, unique_entries, conflicts
+
+def dbcs2sldd_gen(dbc_files, common_file=None, compression="default"):
+    """
+    Generate one Simulink Data Dictionary per DBC file plus a common dictionary
+    holding the buses and enums shared by several DBC files.
+    
+    Each per-DBC dictionary references the common dictionary and keeps only its unique entries.
+    
+    Args:
+        dbc_files (list): Paths to the input DBC files.
+        common_file (str, optional): Path of the common .sldd, defaults to common.sldd next to the first DBC file.
+        compression (str): .sldd archive compression, see slddgen.create_simulink_dd.
+    
+    Returns:
+        list: Conflicts, see split_shared_entries.
+    
+    Raises:
+        validate.ValidationError: If any dictionary fails validation, nothing is written then.
+    """
+    slddzip.check_compression(compression)
+    if common_file is None:
+        common_file = os.path.join(os.path.dirname(dbc_files[0]), "common.sldd")
+    dbc_entries = {}
+    numeric_types = {}
+    for dbc_file in dbc_files:
+        # One symbol table per DBC: identical names in different DBC files are compared by content below
+        symbol_table = symbols.SymbolTable()
+        dbc_entries[dbc_file] = create_bus_entries_from_dbc(dbc_file, load_generate_conf(dbc_file), symbol_table)
+        for line in symbol_table.report(os.path.basename(dbc_file)):
+            print(line)
+        # Numeric type names are derived from the type itself, so they all go to the common dictionary
+        for numeric_type in extract_numeric_types(dbc_entries[dbc_file][0]):
+            numeric_types.update(numeric_type)
+
+    common_bus, common_enums, unique_entries, conflicts = split_shared_entries(dbc_entries)
+    for kind, name, hashes in conflicts:
+        print(f"Conflict: {kind} '{name}' has different definitions in: "
+              + "; ".join(", ".join(os.path.basename(f) for f in files) for files in hashes.values()))
+
+    # Validate all dictionaries before writing any of them
+    common_model = emitters.new_model(buses=common_bus, enums=common_enums,
+                                      numeric_types=[{name: t} for name, t in numeric_types.items()])
+    errors = validate.validate_model(common_model)
+    validate.print_report(errors, os.path.basename(common_file))
+    for dbc_file, (bus_entries, enum_entries) in unique_entries.items():
+        dbc_errors = validate.validate_model(emitters.new_model(buses=bus_entries, enums=enum_entries), [common_model])
+        validate.print_report(dbc_errors, os.path.basename(dbc_file))
+        errors += dbc_errors
+    if errors:
+        raise validate.ValidationError(errors)
+
+    slddgen.create_simulink_dd(common_file, bus_entries=common_bus, enum_entries=common_enums,
+                               numeric_type_entries=common_model["numeric_types"], compression=compression)
+    print(f"\nCommon Simulink Data Dictionary created: {len(common_bus)} buses, {len(common_enums)} enums.\npath:{common_file}")
+    for dbc_file, (bus_entries, enum_entries) in unique_entries.items():
+        sldd_name = os.path.splitext(os.path.basename(dbc_file))[0] + ".sldd"
+        sldd_path = os.path.join(os.path.dirname(dbc_file), sldd_name)
+        slddgen.create_simulink_dd(sldd_path, bus_entries=bus_entries, enum_entries=enum_entries,
+                                   references=[common_file], compression=compression)
+        print(f"Simulink Data Dictionary '{sldd_name}' created: {len(bus_entries)} buses, {len(enum_entries)} enums.\npath:{sldd_path}")
+    return conflicts
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,207 @@
+import os
+import sys
+import sqlite3
+import hashlib
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # Adjust path as needed
+from ddgen import slddread, dbc2sldd, slddgen
+
+INDEX_FILE = ".ddgen_index.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    datatype TEXT
+);
+CREATE TABLE IF NOT EXISTS bus_elements (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    bus TEXT NOT NULL,
+    name TEXT NOT NULL,
+    datatype TEXT,
+    units TEXT,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS enum_values (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    enum TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS params (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    datatype TEXT,
+    dims TEXT,
+    value TEXT,
+    min TEXT,
+    max TEXT,
+    units TEXT,
+    storage_class TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_name ON entries(name);
+CREATE INDEX IF NOT EXISTS bus_elements_name ON bus_elements(name);
+CREATE INDEX IF NOT EXISTS enum_values_name ON enum_values(name);
+CREATE INDEX IF NOT EXISTS params_name ON params(name);
+"""
+
+def connect(db_path):
+    con = sqlite3.connect(db_path)
+    con.execute("PRAGMA foreign_keys = ON")
+    con.executescript(SCHEMA)
+    return con
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def rows_from_sldd(sldd_file):
+    """Stream a .sldd file into index rows: (entries, bus_elements, enum_values, params)."""
+    entries, bus_elements, enum_values, params = [], [], [], []
+    for entry in slddread.iter_sldd_entries(sldd_file):
+        name = entry["Name"]
+        if "Elements" in entry:
+            entries.append((name, "bus", ""))
+            bus_elements += [(name, el["Name"], el["DataType"], el["Units"], el["Description"])
+                             for el in entry["Elements"]]
+        elif "Enumerals" in entry:
+            entries.append((name, "enum", ""))
+            enum_values += [(name, el["Name"], el["Value"]) for el in entry["Enumerals"]]
+        elif "Value" in entry:
+            entries.append((name, "param", entry["DataType"]))
+            params.append((name, entry["DataType"], "x".join(str(d) for d in entry["Dimensions"]),
+                           " ".join(str(v) for v in entry["Value"]), entry["Min"], entry["Max"],
+                           entry["Units"], entry["StorageClass"]))
+        else:
+            entries.append((name, "type", entry.get("DataType", "")))
+    return entries, bus_elements, enum_values, params
+
+def rows_from_dbc(dbc_file):
+    """Index rows of a DBC file, named as in the dictionaries generated from it."""
+    bus_entries, enum_entries = dbc2sldd.create_bus_entries_from_dbc(dbc_file, dbc2sldd.load_generate_conf(dbc_file))
+    # Inline fixdt(...) types become named NumericType entries, as in the generated dictionaries
+    numeric_type_entries = dbc2sldd.extract_numeric_types(bus_entries)
+    entries, bus_elements, enum_values = [], [], []
+    for numeric_type in numeric_type_entries:
+        for type_name, type_dict in numeric_type.items():
+            nt = slddgen.create_numeric_type_entry_value(type_dict)
+            entries.append((type_name, "type", slddread.get_text(slddread.get_props(nt), "DataTypeMode")))
+    for bus_name, elements in bus_entries:
+        entries.append((bus_name, "bus", ""))
+        bus_elements += [(bus_name, el["Name"], el["DataType"], el.get("Units", ""), el.get("Description", ""))
+                         for el in elements]
+    for enum in enum_entries:
+        for enum_name, enum_table in enum.items():
+            entries.append((enum_name, "enum", ""))
+            enum_values += [(enum_name, str(v), str(k)) for k, v in sorted(enum_table.items())]
+    return entries, bus_elements, enum_values, []
+
+def find_files(paths):
+    """Collect .sldd and .dbc files from files and directories (searched recursively)."""
+    found = []
+    for path in paths:
+        if os.path.isfile(path):
+            found.append(os.path.abspath(path))
+            continue
+        for dirpath, _, filenames in os.walk(path):
+            found += [os.path.abspath(os.path.join(dirpath, f)) for f in filenames
+                      if f.lower().endswith((".sldd", ".dbc"))]
+    return sorted(found)
+
+def update_index(paths, db_path=INDEX_FILE):
+    """
+    Incrementally index .sldd and .dbc files into a SQLite database.
+
+    A file is re-parsed only when its mtime changed and its content hash differs
+    from the indexed one. Indexed files that no longer exist are dropped.
+
+    Args:
+        paths (list): Files or directories to index.
+        db_path (str): Path to the SQLite index.
+
+    Returns:
+        tuple: (indexed, unchanged, removed) file counts.
+    """
+    con = connect(db_path)
+    known = {path: (file_id, mtime, digest) for file_id, path, mtime, digest
+             in con.execute("SELECT id, path, mtime, hash FROM files")}
+    indexed = unchanged = 0
+    files = find_files(paths)
+    with con:
+        for path in files:
+            mtime = os.path.getmtime(path)
+            old = known.get(path)
+            if old and old[1] == mtime:
+                unchanged += 1
+                continue
+            digest = file_hash(path)
+            if old and old[2] == digest:
+                con.execute("UPDATE files SET mtime = ? WHERE id = ?", (mtime, old[0]))
+                unchanged += 1
+                continue
+            try:
+                if path.lower().endswith(".dbc"):
+                    rows = rows_from_dbc(path)
+                else:
+                    rows = rows_from_sldd(path)
+            except Exception as e:
+                print(f"Skipping {path}: {e}")
+                continue
+            if old:
+                con.execute("DELETE FROM files WHERE id = ?", (old[0],))
+            file_id = con.execute("INSERT INTO files (path, mtime, hash) VALUES (?, ?, ?)",
+                                  (path, mtime, digest)).lastrowid
+            entries, bus_elements, enum_values, params = rows
+            con.executemany("INSERT INTO entries VALUES (?, ?, ?, ?)", [(file_id,) + r for r in entries])
+            con.executemany("INSERT INTO bus_elements VALUES (?, ?, ?, ?, ?, ?)", [(file_id,) + r for r in bus_elements])
+            con.executemany("INSERT INTO enum_values VALUES (?, ?, ?, ?)", [(file_id,) + r for r in enum_values])
+            con.executemany("INSERT INTO params VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [(file_id,) + r for r in params])
+            indexed += 1
+        # Drop files that were indexed from the same locations but are gone now
+        roots = tuple(os.path.abspath(p) for p in paths)
+        removed = [(file_id,) for path, (file_id, _, _) in known.items()
+                   if path.startswith(roots) and not os.path.exists(path)]
+        con.executemany("DELETE FROM files WHERE id = ?", removed)
+    con.close()
+    return indexed, unchanged, len(removed)
+
+QUERY = """
+SELECT e.kind, e.name, e.datatype, '', f.path FROM entries e JOIN files f ON f.id = e.file_id WHERE e.name {op} ?
+UNION ALL
+SELECT 'signal', b.name, b.datatype, b.bus, f.path FROM bus_elements b JOIN files f ON f.id = b.file_id WHERE b.name {op} ?
+UNION ALL
+SELECT 'enum value', v.name, v.value, v.enum, f.path FROM enum_values v JOIN files f ON f.id = v.file_id WHERE v.name {op} ?
+"""
+
+def query_index(pattern, db_path=INDEX_FILE, kind=None):
+    """
+    Look up symbols in the index.
+
+    Args:
+        pattern (str): Exact name, or a glob pattern (*, ?, [...]).
+        db_path (str): Path to the SQLite index.
+        kind (str, optional): Only return rows of this kind: bus, enum, param, type, signal, enum value.
+
+    Returns:
+        list: Tuples (kind, name, datatype, parent, path).
+    """
+    op = "GLOB" if any(c in pattern for c in "*?[") else "="
+    con = connect(db_path)
+    sql = f"SELECT * FROM ({QUERY.format(op=op)})"
+    args = [pattern] * 3
+    if kind:
+        sql += " WHERE kind = ?"
+        args.append(kind)
+    rows = con.execute(sql + " ORDER BY 2, 5", args).fetchall()
+    con.close()
+    return rows
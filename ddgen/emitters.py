@@ -0,0 +1,197 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # Adjust path as needed
+from ddgen import slddgen, layout
+
+# Model layout shared by all emitters, filled once by the generators (dbc2sldd, pars2sldd):
+#   params: parameter dictionaries, see slddgen.create_param_entry_value
+#   buses: tuples (bus_name, elements)
+#   enums: dictionaries {enum_name: {int_value: name}}
+#   numeric_types: dictionaries {type_name: type_dict}, see slddgen.create_numeric_type_entry_value
+#   bus_alignments: {bus_name: alignment}
+#   groups (optional): {group_name: (params, buses)} to split the .sldd, see slddgen.create_simulink_dd_split
+
+C_TYPES = {
+    "boolean": "boolean_T", "int8": "int8_T", "uint8": "uint8_T", "int16": "int16_T", "uint16": "uint16_T",
+    "int32": "int32_T", "uint32": "uint32_T", "int64": "int64_T", "uint64": "uint64_T",
+    "single": "real32_T", "double": "real_T",
+}
+
+def new_model(params=[], buses=[], enums=[], numeric_types=[], bus_alignments={}, groups=None):
+    model = {
+        "params": params,
+        "buses": buses,
+        "enums": enums,
+        "numeric_types": numeric_types,
+        "bus_alignments": bus_alignments,
+    }
+    if groups:
+        model["groups"] = groups
+    return model
+
+def emit_sldd(output_base, model, compression="default", chunk_size=None):
+    """
+    Write the Simulink Data Dictionary <output_base>.sldd (split into sub-dictionaries if the model has groups).
+
+    compression and chunk_size select the archive layout, see slddgen.create_simulink_dd.
+    """
+    output_file = output_base + ".sldd"
+    if model.get("groups"):
+        sub_files = slddgen.create_simulink_dd_split(output_file, model["groups"], enum_entries=model["enums"],
+                                                     numeric_type_entries=model["numeric_types"],
+                                                     bus_alignments=model["bus_alignments"],
+                                                     compression=compression, chunk_size=chunk_size)
+        print("Sub-dictionaries: " + ", ".join(os.path.basename(f) for f in sub_files))
+    else:
+        slddgen.create_simulink_dd(output_file, params_entries=model["params"], bus_entries=model["buses"],
+                                   enum_entries=model["enums"], numeric_type_entries=model["numeric_types"],
+                                   bus_alignments=model["bus_alignments"],
+                                   compression=compression, chunk_size=chunk_size)
+    return output_file
+
+def m_str(text):
+    """MATLAB char literal, line breaks are concatenated as char(10)."""
+    lines = str(text if text is not None else "").replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    literals = ["'" + line.replace("'", "''") + "'" for line in lines]
+    return literals[0] if len(literals) == 1 else "[" + " char(10) ".join(literals) + "]"
+
+def m_num(value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return "[]"
+    if value != value:
+        return "NaN"
+    return repr(int(value)) if value == int(value) else repr(value)
+
+def emit_matlab(output_base, model):
+    """Write a MATLAB script <output_base>.m that defines the model objects in the base workspace."""
+    output_file = output_base + ".m"
+    name = os.path.basename(output_base)
+    lines = [f"% {name}.m - generated by ddgen", ""]
+    if model["enums"]:
+        lines.append("%% Enums")
+    for enum_dict in model["enums"]:
+        for enum_name, enum_table in enum_dict.items():
+            items = sorted(enum_table.items())
+            names = ", ".join(m_str(v) for _, v in items)
+            values = " ".join(str(k) for k, _ in items)
+            lines.append(f"Simulink.defineIntEnumType({m_str(enum_name)}, {{{names}}}, [{values}], "
+                         f"'DefaultValue', {m_str(items[0][1])}, 'AddClassNameToEnumNames', true);")
+    if model["numeric_types"]:
+        lines += ["", "%% Numeric types"]
+    for numeric_type_dict in model["numeric_types"]:
+        for type_name, t in numeric_type_dict.items():
+            lines.append(f"{type_name} = fixdt({int(t['Signed'])}, {t['WordLength']}, "
+                         f"{m_num(t['Slope'])}, {m_num(t['Bias'])});")
+    if model["buses"]:
+        lines += ["", "%% Buses"]
+    for bus_name, elements in model["buses"]:
+        lines.append("clear elems;")
+        for i, el in enumerate(elements, 1):
+            lines.append(f"elems({i}) = Simulink.BusElement; elems({i}).Name = {m_str(el['Name'])}; "
+                         f"elems({i}).DataType = {m_str(el['DataType'])}; elems({i}).Dimensions = {el['Dimensions']}; "
+                         f"elems({i}).Description = {m_str(el.get('Description', ''))}; "
+                         f"elems({i}).DocUnits = {m_str(el.get('Units', ''))};")
+        lines.append(f"{bus_name} = Simulink.Bus; {bus_name}.Elements = elems;")
+        alignment = model["bus_alignments"].get(bus_name, -1)
+        if alignment != -1:
+            lines.append(f"{bus_name}.Alignment = {alignment};")
+    if model["params"]:
+        lines += ["", "%% Parameters"]
+    for p in model["params"]:
+        rows, cols = p["Dimensions"]
+        values = " ".join(m_num(v) for v in p["Value"])
+        value = m_num(p["Value"][0]) if len(p["Value"]) == 1 else f"reshape([{values}], {rows}, {cols})"
+        par = p["Name"]
+        lines.append(f"{par} = {p.get('ElementClass', 'Simulink.Parameter')}; {par}.Value = {value};")
+        lines.append(f"{par}.DataType = {m_str(p.get('DataType') or 'auto')}; {par}.Min = {m_num(p.get('Min'))}; "
+                     f"{par}.Max = {m_num(p.get('Max'))}; {par}.DocUnits = {m_str(p.get('Units', ''))}; "
+                     f"{par}.Description = {m_str(p.get('Description', ''))};")
+        coder_info = p.get("CoderInfo") or {}
+        if coder_info.get("CSCPackageName", "Simulink") == "Simulink" and coder_info:
+            lines.append(f"{par}.CoderInfo.StorageClass = {m_str(coder_info.get('StorageClass', 'Custom'))}; "
+                         f"{par}.CoderInfo.CustomStorageClass = {m_str(coder_info.get('CustomStorageClass', 'Calibration'))};")
+        elif coder_info:
+            lines.append(f"{par}.CoderInfo.CustomStorageClass = {m_str(coder_info.get('CustomStorageClass', 'Calibration'))};")
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return output_file
+
+def c_type(data_type):
+    """C type used by generated code for a Simulink data type."""
+    if data_type in C_TYPES:
+        return C_TYPES[data_type]
+    if data_type.startswith("Enum: "):
+        return data_type[len("Enum: "):]
+    if data_type.startswith("fixdt("):
+        size = layout.data_type_size(data_type)
+        signed = data_type.replace(" ", "").startswith("fixdt(1")
+        return f"{'' if signed else 'u'}int{8 * size}_T"
+    return data_type
+
+def c_comment(text):
+    """Text safe to put in a /* */ comment on one line."""
+    return " ".join(str(text if text is not None else "").split()).replace("*/", "* /")
+
+def emit_c_header(output_base, model):
+    """Write a C header <output_base>.h with the enum and struct typedefs and parameter declarations."""
+    output_file = output_base + ".h"
+    name = os.path.basename(output_base)
+    guard = name.upper().replace("-", "_").replace(".", "_") + "_H"
+    lines = [f"/* {name}.h - generated by ddgen */", f"#ifndef {guard}", f"#define {guard}", "",
+             '#include "rtwtypes.h"', ""]
+    for enum_dict in model["enums"]:
+        for enum_name, enum_table in enum_dict.items():
+            lines.append("typedef enum {")
+            items = sorted(enum_table.items())
+            lines += [f"  {enum_name}_{v} = {k}{',' if i < len(items) - 1 else ''}" for i, (k, v) in enumerate(items)]
+            lines += [f"}} {enum_name};", ""]
+    for numeric_type_dict in model["numeric_types"]:
+        for type_name, t in numeric_type_dict.items():
+            storage = f"{'' if t['Signed'] else 'u'}int{8 * layout.data_type_size(type_name)}_T"
+            lines.append(f"typedef {storage} {type_name}; /* {c_comment(t.get('Description', ''))} */")
+    if model["numeric_types"]:
+        lines.append("")
+    for bus_name, elements in model["buses"]:
+        lines.append("typedef struct {")
+        for el in elements:
+            dims = int(el["Dimensions"])
+            lines.append(f"  {c_type(el['DataType'])} {el['Name']}{f'[{dims}]' if dims > 1 else ''};")
+        lines += [f"}} {bus_name};", ""]
+    for p in model["params"]:
+        count = len(p["Value"])
+        lines.append(f"extern {c_type(p.get('DataType') or 'double')} {p['Name']}{f'[{count}]' if count > 1 else ''};")
+    lines += ["", f"#endif /* {guard} */"]
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return output_file
+
+EMITTERS = {
+    "sldd": emit_sldd,
+    "m": emit_matlab,
+    "h": emit_c_header,
+}
+
+def emit_all(output_base, model, targets=("sldd",), sldd_options=None):
+    """
+    Write all selected targets from one model, running the emitters concurrently.
+
+    Args:
+        output_base (str): Output path without extension.
+        model (dict): See new_model.
+        targets (iterable): Keys of EMITTERS.
+        sldd_options (dict, optional): Keyword arguments of emit_sldd (compression, chunk_size).
+
+    Returns:
+        list: Paths of the written files.
+    """
+    unknown = [t for t in targets if t not in EMITTERS]
+    if unknown:
+        raise ValueError(f"Unknown target(s): {', '.join(unknown)}. Available: {', '.join(EMITTERS)}")
+    with ThreadPoolExecutor(max_workers=len(targets) or 1) as pool:
+        futures = [pool.submit(EMITTERS[t], output_base, model, **(sldd_options or {}) if t == "sldd" else {})
+                   for t in targets]
+        return [f.result() for f in futures]
@@ -0,0 +1,85 @@
+import re
+
+# Size in bytes of the C types Simulink generates for its built-in data types
+DATA_TYPE_SIZES = {
+    "boolean": 1, "int8": 1, "uint8": 1,
+    "int16": 2, "uint16": 2,
+    "int32": 4, "uint32": 4, "single": 4,
+    "int64": 8, "uint64": 8, "double": 8,
+}
+ENUM_SIZE = 4  # Simulink enums are stored as int32 unless StorageType says otherwise
+UNKNOWN_SIZE = 8  # nested buses and other types: assume the worst alignment
+
+_FIXDT_INLINE = re.compile(r"fixdt\(\s*[01]\s*,\s*(\d+)")
+_FIXDT_NAME = re.compile(r"[su]fix(\d+)(_|$)")
+
+def data_type_size(data_type):
+    """Size in bytes of a bus element data type, which is also its natural alignment."""
+    if data_type in DATA_TYPE_SIZES:
+        return DATA_TYPE_SIZES[data_type]
+    if data_type.startswith("Enum: "):
+        return ENUM_SIZE
+    match = _FIXDT_INLINE.match(data_type) or _FIXDT_NAME.match(data_type)
+    if match:
+        word_length = int(match.group(1))
+        return next((size for size in (1, 2, 4, 8) if word_length <= 8 * size), UNKNOWN_SIZE)
+    return UNKNOWN_SIZE
+
+def struct_layout(elements):
+    """
+    Compute the C struct layout of bus elements with natural alignment.
+
+    Args:
+        elements (list): Dictionaries with keys DataType and Dimensions.
+
+    Returns:
+        tuple: (size, padding, alignment) in bytes.
+    """
+    offset = 0
+    payload = 0
+    alignment = 1
+    for el in elements:
+        type_size = data_type_size(el["DataType"])
+        size = type_size * int(el.get("Dimensions", 1))
+        offset = -(-offset // type_size) * type_size
+        offset += size
+        payload += size
+        alignment = max(alignment, type_size)
+    size = -(-offset // alignment) * alignment
+    return size, size - payload, alignment
+
+def layout_bus_elements(elements):
+    """Order bus elements by decreasing alignment, which leaves no padding between elements."""
+    return sorted(elements, key=lambda el: -data_type_size(el["DataType"]))
+
+def pack_bus_entries(bus_entries):
+    """
+    Reorder the elements of every bus to minimize the generated C struct size.
+
+    Args:
+        bus_entries (list): Tuples (bus_name, elements).
+
+    Returns:
+        tuple: (bus_entries, bus_alignments, report)
+            bus_alignments is {bus_name: alignment} for slddgen.create_simulink_dd,
+            report is a list of (bus_name, old_size, new_size, old_padding, new_padding).
+    """
+    packed = []
+    bus_alignments = {}
+    report = []
+    for bus_name, elements in bus_entries:
+        old_size, old_padding, _ = struct_layout(elements)
+        elements = layout_bus_elements(elements)
+        new_size, new_padding, alignment = struct_layout(elements)
+        packed.append((bus_name, elements))
+        bus_alignments[bus_name] = alignment
+        report.append((bus_name, old_size, new_size, old_padding, new_padding))
+    return packed, bus_alignments, report
+
+def print_layout_report(report):
+    for bus_name, old_size, new_size, old_padding, new_padding in report:
+        if old_size != new_size:
+            print(f"{bus_name}: {old_size} -> {new_size} bytes (padding {old_padding} -> {new_padding})")
+    old_total = sum(r[1] for r in report)
+    new_total = sum(r[2] for r in report)
+    print(f"Bus layout: {len(report)} buses, {old_total} -> {new_total} bytes, saved {old_total - new_total} bytes")
@@ -1,9 +1,8 @@
 import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # Adjust path as needed
-from ddgen import slddgen
+from ddgen import symbols, emitters, validate, slddzip
 import pandas as pd
-import numpy as np
 
 def get_coder_info(name):
     match name:
@@ -33,19 +32,29 @@ def get_coder_info(name):
         
     return (ElementClass,coder_info)
     
-def create_pars_entries_from_xls(xsl_file,par_type):
+def create_pars_entries_from_xls(xsl_file,par_type,sheet_name=0,symbol_table=None):
     """
-    Read a DBC file and create a Simulink Data Dictionary with buses for each CAN message.
+    Read a parameters workbook and create Simulink Data Dictionary parameter entries.
     
     Args:
-        dbc_file (str): Path to the input DBC file.
-        output_file (str): Path to the output .sldd file.
+        xsl_file (str): Path to the input Excel file.
+        par_type (str): Coder info preset, see get_coder_info.
+        sheet_name: Sheet to read (index or name). None reads all sheets.
+        symbol_table (symbols.SymbolTable, optional): Table the parameter names are registered in.
+    
+    Returns:
+        list: Parameter dictionaries, or {sheet_name: list} when sheet_name is None.
     """
-    # Load DBC file
-    # db = canmatrix.formats.loadp(dbc_file, "dbc")
     ElementClass,coder_info=get_coder_info(par_type)
+    if symbol_table is None:
+        symbol_table = symbols.SymbolTable()
     
-    df=pd.read_excel(xsl_file)
+    df=pd.read_excel(xsl_file,sheet_name=sheet_name)
+    if isinstance(df, dict):
+        return {name: create_pars_entries_from_df(sheet_df,ElementClass,coder_info,symbol_table) for name, sheet_df in df.items()}
+    return create_pars_entries_from_df(df,ElementClass,coder_info,symbol_table)
+
+def create_pars_entries_from_df(df,ElementClass,coder_info,symbol_table):
     pars_entries=[]
     value_fld_names=['Value_'+str(i+1) for i in range(10)]
     col_names=df.columns.values
@@ -53,27 +62,36 @@ def create_pars_entries_from_xls(xsl_file,par_type):
     col_dict=dict(zip(col_names,col_names1))
     df.rename(columns=col_dict,inplace=1)
     for index, row in df.iterrows():
-        dims=[row['Dimensions_1'], row['Dimensions_2']]
-        dim_max = max(dims)
+        # Missing columns and empty cells are kept as None/NaN and reported by validate.validate_model
+        dims=[row.get('Dimensions_1'), row.get('Dimensions_2')]
+        try:
+            count=max(int(dims[0])*int(dims[1]), 0)
+        except (TypeError, ValueError):
+            # No values without valid dimensions, so only the Dimensions are reported
+            count=0
         
-        values = row[value_fld_names].values
-        val=values[0:dim_max].tolist()
+        values = row.reindex(value_fld_names).values
+        val=values[0:count].tolist()
         # val=[v.item() for v in val]
-        if np.isnan(val).any():
-            print('!')
         # if len(val)==1:
         #     val=val[0]
+        name=row.get('Name')
+        description=row.get("Description")
+        unit=row.get('Unit')
+        data_type=row.get("DataType")
             
         param_dict = {
         "ElementClass": ElementClass,
-        "Name": row['Name'],
+        "Name": symbol_table.add(name, "param") if isinstance(name, str) else name,
         "Dimensions": dims,
         "Value": val,
-        "Units": row['Unit'],
-        "Description": row["Description"],
-        "DataType": row["DataType"],
-        "Min": row["Min"],
-        "Max": row["Max"],
+        # Empty Unit cells are valid (boolean and index parameters), a missing Unit column is not
+        "Units": None if 'Unit' not in row.index else ("" if pd.isna(unit) else str(unit)),
+        "Description": description if isinstance(description, str) else "",
+        # Empty DataType cells: create_param_entry_value and the emitters infer the type
+        "DataType": None if pd.isna(data_type) else data_type,
+        "Min": row.get("Min"),
+        "Max": row.get("Max"),
         "CoderInfo": coder_info
     }
         pars_entries.append(param_dict)
@@ -103,25 +121,50 @@ def create_pars_entries_from_xls(xsl_file,par_type):
 #                 raise ValueError(f"Element {element} in bus {bus_name} is missing required keys.")
         
 #     return bus_entries
-def pars2sldd_gen(inp_file,par_type="import_from_file"):
+def pars2sldd_gen(inp_file,par_type="import_from_file",split_by_sheet=False,targets=("sldd",),validate_only=False,
+                  compression="default",chunk_size=None):
     """
-    Generate a Simulink Data Dictionary from a DBC file.
+    Generate a Simulink Data Dictionary from a parameters workbook.
     
-    This function reads a DBC file, extracts CAN messages and their signals,
-    and creates a Simulink Data Dictionary with buses for each message.
+    With split_by_sheet, every workbook sheet goes to its own sub-dictionary
+    referenced by the top-level dictionary. targets selects the outputs written
+    from the same parsed parameters, see emitters.EMITTERS. compression and chunk_size
+    select the .sldd archive layout, see slddgen.create_simulink_dd.
+    
+    All parameters are validated before anything is written, see validate.validate_model.
     
     Returns:
-        None
+        list: Validation errors (empty when the outputs were written).
+    
+    Raises:
+        validate.ValidationError: If validation fails and validate_only is False.
     """
     # Example DBC file path (replace with actual path)
     # dbc_file = "example.dbc"
+    slddzip.check_compression(compression)
     sldd_name= os.path.splitext(os.path.basename(inp_file))[0] + ".sldd"
     sldd_path = os.path.join(os.path.dirname(inp_file), sldd_name)
-    # Create Simulink Data Dictionary from DBC
-    pars_entries=create_pars_entries_from_xls(inp_file,par_type)
-    # print([msg for (msg,_) in bus_entries])
-    slddgen.create_simulink_dd(sldd_path,params_entries=pars_entries)
-    print(f"\nSimulink Data Dictionary '{sldd_name}' created successfully from {inp_file} file.\npath:{sldd_path}")
+    symbol_table = symbols.SymbolTable()
+    if split_by_sheet:
+        sheets=create_pars_entries_from_xls(inp_file,par_type,sheet_name=None,symbol_table=symbol_table)
+        model=emitters.new_model(params=[p for pars_entries in sheets.values() for p in pars_entries],
+                                 groups={sheet.replace(' ','_'): (pars_entries,[]) for sheet, pars_entries in sheets.items()})
+    else:
+        pars_entries=create_pars_entries_from_xls(inp_file,par_type,symbol_table=symbol_table)
+        # print([msg for (msg,_) in bus_entries])
+        model=emitters.new_model(params=pars_entries)
+    for line in symbol_table.report(os.path.basename(inp_file)):
+        print(line)
+    errors=validate.validate_model(model)
+    validate.print_report(errors,os.path.basename(inp_file))
+    if validate_only:
+        return errors
+    if errors:
+        raise validate.ValidationError(errors)
+    output_files=emitters.emit_all(os.path.splitext(sldd_path)[0],model,targets,
+                                   {"compression": compression, "chunk_size": chunk_size})
+    print(f"\nCreated successfully from {inp_file} file:\n" + "\n".join(f"path:{f}" for f in output_files))
+    return errors
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+import os
+import sys
+import csv
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # Adjust path as needed
+from ddgen import slddread
+
+PARAM_COLUMNS = ["Name", "Rows", "Cols", "DataType", "Min", "Max", "Units", "StorageClass", "Description", "Value"]
+BUS_ELEMENT_COLUMNS = ["Bus", "Name", "DataType", "Dimensions", "Units", "Description"]
+ENUM_VALUE_COLUMNS = ["Enum", "Name", "Value", "Description"]
+
+def to_float(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return np.nan
+
+def iter_table_rows(sldd_file):
+    """
+    Stream the rows of the exported tables from a .sldd file.
+
+    Yields:
+        tuple: (table_name, row) with table_name params, bus_elements or enum_values and row
+            in the order of the matching *_COLUMNS list. Parameter values stay NumPy arrays.
+    """
+    for entry in slddread.iter_sldd_entries(sldd_file):
+        if "Elements" in entry:
+            for el in entry["Elements"]:
+                yield "bus_elements", (entry["Name"], el["Name"], el["DataType"], el["Dimensions"],
+                                       el["Units"], el["Description"])
+        elif "Enumerals" in entry:
+            for el in entry["Enumerals"]:
+                yield "enum_values", (entry["Name"], el["Name"], el["Value"], el["Description"])
+        elif "Value" in entry:
+            dims = entry["Dimensions"] + [1] * (2 - len(entry["Dimensions"]))
+            yield "params", (entry["Name"], dims[0], dims[1], entry["DataType"], entry["Min"], entry["Max"],
+                             entry["Units"], entry["StorageClass"], entry["Description"], entry["Value"])
+
+def export_csv(sldd_file, output_base):
+    """Write <output_base>_params.csv, _bus_elements.csv and _enum_values.csv while streaming the dictionary."""
+    columns = {"params": PARAM_COLUMNS, "bus_elements": BUS_ELEMENT_COLUMNS, "enum_values": ENUM_VALUE_COLUMNS}
+    paths = {table: f"{output_base}_{table}.csv" for table in columns}
+    files = {table: open(path, "w", newline="", encoding="utf-8") for table, path in paths.items()}
+    try:
+        writers = {table: csv.writer(files[table]) for table in columns}
+        for table, header in columns.items():
+            writers[table].writerow(header)
+        for table, row in iter_table_rows(sldd_file):
+            if table == "params":
+                # Lookup table values as one space separated cell
+                row = row[:-1] + (" ".join(str(v) for v in row[-1]),)
+            writers[table].writerow(row)
+    finally:
+        for f in files.values():
+            f.close()
+    return list(paths.values())
+
+def export_parquet(sldd_file, output_base):
+    """
+    Write <output_base>_params.parquet, _bus_elements.parquet and _enum_values.parquet.
+
+    Parameter values are stored as a list<double> column built from one flat
+    NumPy array and offsets, so lookup tables are not converted value by value.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export needs pyarrow: pip install pyarrow")
+    columns = {"params": PARAM_COLUMNS, "bus_elements": BUS_ELEMENT_COLUMNS, "enum_values": ENUM_VALUE_COLUMNS}
+    data = {table: [[] for _ in header] for table, header in columns.items()}
+    for table, row in iter_table_rows(sldd_file):
+        for col, v in zip(data[table], row):
+            col.append(v)
+
+    params = dict(zip(PARAM_COLUMNS, data["params"]))
+    values = [np.asarray([to_float(v) for v in vals]) if isinstance(vals, list) else vals for vals in params["Value"]]
+    offsets = np.zeros(len(values) + 1, dtype=np.int32)
+    np.cumsum([len(v) for v in values], out=offsets[1:])
+    flat = np.concatenate(values) if values else np.array([], dtype=float)
+    params["Value"] = pa.ListArray.from_arrays(pa.array(offsets), pa.array(flat, pa.float64()))
+    params["Min"] = np.array([to_float(v) for v in params["Min"]])
+    params["Max"] = np.array([to_float(v) for v in params["Max"]])
+    tables = {
+        "params": pa.table(params),
+        "bus_elements": pa.table(dict(zip(BUS_ELEMENT_COLUMNS, data["bus_elements"]))),
+        "enum_values": pa.table(dict(zip(ENUM_VALUE_COLUMNS, data["enum_values"]))),
+    }
+    paths = []
+    for table_name, table in tables.items():
+        path = f"{output_base}_{table_name}.parquet"
+        pq.write_table(table, path)
+        paths.append(path)
+    return paths
+
+EXPORTERS = {
+    "csv": export_csv,
+    "parquet": export_parquet,
+}
+
+def export_sldd(sldd_file, output_dir=None, fmt="csv"):
+    """
+    Export parameters, bus elements and enum values of a .sldd file as tables.
+
+    Args:
+        sldd_file (str): Path to the .sldd file.
+        output_dir (str, optional): Output directory, defaults to the directory of sldd_file.
+        fmt (str): 'csv' or 'parquet'.
+
+    Returns:
+        list: Paths of the written files.
+    """
+    if fmt not in EXPORTERS:
+        raise ValueError(f"Unknown export format: {fmt}. Available: {', '.join(EXPORTERS)}")
+    if output_dir is None:
+        output_dir = os.path.dirname(sldd_file)
+    output_base = os.path.join(output_dir, os.path.splitext(os.path.basename(sldd_file))[0])
+    return EXPORTERS[fmt](sldd_file, output_base)
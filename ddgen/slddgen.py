@@ -1,10 +1,14 @@
 import xml.etree.ElementTree as ET
-import zipfile
 import os
+import sys
 import uuid
+import math
 from datetime import datetime
 from xml.dom import minidom
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # Adjust path as needed
+from ddgen import slddzip, symbols
+
 NAMESPACE = "dacaf35e-55a5-454d-a7c1-93db038a210e"
 
 def create_bus_element(element_dict):
@@ -23,10 +27,10 @@ def create_bus_element(element_dict):
     ET.SubElement(elem, "P", Name="Dimensions", Class="double").text = str(element_dict["Dimensions"])
     return elem
 
-def create_bus(elements):
-    """Create a Simulink.Bus XML element from a bus name and list of element dictionaries."""
+def create_bus(elements, alignment=-1.0):
+    """Create a Simulink.Bus XML element from a list of element dictionaries, alignment -1.0 is the Simulink default."""
     bus = ET.Element("Element", Class="Simulink.Bus")
-    ET.SubElement(bus, "P", Name="Alignment", Class="double").text = "-1.0"
+    ET.SubElement(bus, "P", Name="Alignment", Class="double").text = str(float(alignment))
     ET.SubElement(bus, "P", Name="PreserveElementDimensions", Class="logical").text = "0"
     elements_prop = ET.SubElement(bus, "P", Name="Elements_internal", Dimension=f"{len(elements)}*1")
     for element_dict in elements:
@@ -36,18 +40,19 @@ def create_bus(elements):
     ET.SubElement(bus, "P", Name="HeaderFile", Class="char")
     return bus
 
-def create_simulink_bus(root,bus_name, elements):
+def create_simulink_bus(root,bus_name, elements, alignment=-1.0):
     """
     Create a Simulink Bus XML element.
     
     Args:
         bus_name (str): Name of the Simulink Bus.
         elements (list): List of dictionaries with keys: Name, DataType, Dimensions, Description (optional), DocUnits (optional).
+        alignment (float): Bus alignment in bytes, -1.0 for the Simulink default.
     
     Returns:
         ET.Element: The Simulink.Bus XML element.
     """
-    bus_value=create_bus(elements)
+    bus_value=create_bus(elements, alignment)
     create_dd_entry(root,bus_name,bus_value)
     # ET.SubElement(root,obj)
     # obj = ET.SubElement(root, "Object", Class="DD.ENTRY")
@@ -73,6 +78,16 @@ def create_dd_entry(root,name,value_cont):
     value.append(value_cont)
     return
 
+def create_dd_reference(root, ref_file):
+    """Add a reference to another data dictionary file (e.g. a shared common.sldd)."""
+    obj = ET.SubElement(root, "Object", Class="DD.Reference")
+    ET.SubElement(obj, "P", Name="Name", Class="char").text = os.path.basename(ref_file)
+    ET.SubElement(obj, "P", Name="UUID", Class="char").text = str(uuid.uuid4())
+    ET.SubElement(obj, "P", Name="Namespace", Class="char").text = NAMESPACE
+    ET.SubElement(obj, "P", Name="LastMod", Class="char").text = datetime.now().strftime("%Y%m%dT%H%M%S.%f")
+    ET.SubElement(obj, "P", Name="LastModBy", Class="char").text = "robot"
+    return
+
 def create_param_entry_value(param_dict):
     """
     Create a Simulink Data Dictionary parameter entry from an input dictionary.
@@ -230,6 +245,42 @@ def create_simulink_enum(root, enum_dict):
     create_dd_entry(root,enum_dict_name,enum_element)
     return
 
+def create_numeric_type_entry_value(type_dict):
+    """
+    Create a Simulink.NumericType fixed-point XML element from a dictionary.
+    Args:
+        type_dict (dict): Signed (bool), WordLength (int), Slope (float), Bias (float), Description (str, optional).
+    Returns:
+        ET.Element: Simulink.NumericType XML element
+    """
+    # Slope = SlopeAdjustmentFactor * 2^FixedExponent with 1 <= SlopeAdjustmentFactor < 2
+    mantissa, exponent = math.frexp(type_dict["Slope"])
+    slope_adjustment, fixed_exponent = 2 * mantissa, exponent - 1
+    binary_point = slope_adjustment == 1.0 and type_dict["Bias"] == 0
+    nt = ET.Element("Element", Class="Simulink.NumericType")
+    ET.SubElement(nt, "P", Name="DataTypeMode", Class="char").text = (
+        "Fixed-point: binary point scaling" if binary_point else "Fixed-point: slope and bias scaling")
+    ET.SubElement(nt, "P", Name="Signedness", Class="char").text = "Signed" if type_dict["Signed"] else "Unsigned"
+    ET.SubElement(nt, "P", Name="WordLength", Class="double").text = str(float(type_dict["WordLength"]))
+    if binary_point:
+        ET.SubElement(nt, "P", Name="FractionLength", Class="double").text = str(float(-fixed_exponent))
+    else:
+        ET.SubElement(nt, "P", Name="SlopeAdjustmentFactor", Class="double").text = str(slope_adjustment)
+        ET.SubElement(nt, "P", Name="FixedExponent", Class="double").text = str(float(fixed_exponent))
+        ET.SubElement(nt, "P", Name="Bias", Class="double").text = str(float(type_dict["Bias"]))
+    ET.SubElement(nt, "P", Name="DataTypeOverride", Class="char").text = "Inherit"
+    ET.SubElement(nt, "P", Name="IsAlias", Class="logical").text = "0"
+    ET.SubElement(nt, "P", Name="DataScope", Class="char").text = "Auto"
+    ET.SubElement(nt, "P", Name="HeaderFile", Class="char").text = ""
+    ET.SubElement(nt, "P", Name="Description", Class="char").text = type_dict.get("Description", "")
+    return nt
+
+def create_simulink_numeric_type(root, numeric_type_dict):
+    type_name=list(numeric_type_dict.keys())[0]
+    type_element=create_numeric_type_entry_value(numeric_type_dict[type_name])
+    create_dd_entry(root,type_name,type_element)
+    return
+
 # def indent(elem, level=0):
 #     """Add indentation to an XML element for pretty printing."""
 #     indent_str = "  "  # Two spaces per level
@@ -246,21 +297,26 @@ def create_simulink_enum(root, enum_dict):
 #         if level and (not elem.tail or not elem.tail.strip()):
 #             elem.tail = "\n" + indent_str * level
 
-def create_simulink_dd(output_file,params_entries=[],bus_entries=[], enum_entries=[]):
+def create_simulink_dd(output_file,params_entries=[],bus_entries=[], enum_entries=[], references=[], numeric_type_entries=[], bus_alignments={},
+                       compression="default", chunk_size=None):
     """
     Create a Simulink Data Dictionary with a Bus object and additional files, saved as a zipped .sldd.
     
     Args:
-        bus_name (str): Name of the Simulink Bus.
-        bus_element (ET.Element): The Simulink.Bus XML element.
         output_file (str): Path to the output .sldd file.
+        params_entries (list): Parameter dictionaries, see create_param_entry_value.
+        bus_entries (list): Tuples (bus_name, elements).
+        enum_entries (list): Dictionaries {enum_name: {int_value: name}}.
+        references (list): Paths of data dictionaries referenced by this one.
+        numeric_type_entries (list): Dictionaries {type_name: type_dict}, see create_numeric_type_entry_value.
+        bus_alignments (dict): {bus_name: alignment} for buses that do not use the Simulink default alignment.
+        compression (str): Archive compression, see slddzip.COMPRESSION: stored, fast, default or best.
+        chunk_size (int, optional): Maximum number of objects per data/chunkN.xml. Chunks are compressed
+            in parallel, by default everything goes to data/chunk0.xml.
+    
+    Returns:
+        tuple: (raw_size, archive_size, seconds), see slddzip.write_archive.
     """
-    # Create temporary directory for files
-    temp_dir = "temp_sldd"
-    os.makedirs(temp_dir, exist_ok=True)
-    os.makedirs(os.path.join(temp_dir, "_rels"), exist_ok=True)
-    os.makedirs(os.path.join(temp_dir, "data"), exist_ok=True)
-
     # Create [Content_Types].xml
     content_types = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
@@ -269,20 +325,9 @@ def create_simulink_dd(output_file,params_entries=[],bus_entries=[], enum_entrie
 </Types>'''
     # Parse and pretty-print [Content_Types].xml
     content_types_xml = minidom.parseString(content_types)
-    with open(os.path.join(temp_dir, "[Content_Types].xml"), "w", encoding="utf-8") as f:
-        f.write(content_types_xml.toprettyxml(indent="  ", newl="\n", encoding="utf-8").decode("utf-8"))
+    members = [("[Content_Types].xml", content_types_xml.toprettyxml(indent="  ", newl="\n", encoding="utf-8"))]
 
-    # Create _rels/.rels
-    rels = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-    <Relationship Id="rId1" Target="data/chunk0.xml" Type="http://schemas.mathworks.com/simulink/2010/relationships/dictionaryChunk"/>
-</Relationships>'''
-    # Parse and pretty-print _rels/.rels
-    rels_xml = minidom.parseString(rels)
-    with open(os.path.join(temp_dir, "_rels", ".rels"), "w", encoding="utf-8") as f:
-        f.write(rels_xml.toprettyxml(indent="  ", newl="\n", encoding="utf-8").decode("utf-8"))
-
-    # Create data/chunk0.xml
+    # Create the data/chunkN.xml roots
     root = ET.Element("DataSource", FormatVersion="1", MinRelease="R2014a", Arch="win64")
     # obj = ET.SubElement(root, "Object", Class="DD.ENTRY")
     # ET.SubElement(obj, "P", Name="Name", Class="char").text = bus_name
@@ -294,41 +339,97 @@ def create_simulink_dd(output_file,params_entries=[],bus_entries=[], enum_entrie
     # value = ET.SubElement(obj, "P", Name="Value")
     # value.append(bus_element)
     for bus_name, bus_elements in bus_entries:
-        create_simulink_bus(root,bus_name, bus_elements)
+        create_simulink_bus(root,bus_name, bus_elements, bus_alignments.get(bus_name, -1.0))
     for param_dict in params_entries:
         create_simulink_param(root, param_dict)
     for enum_dict in enum_entries:
         create_simulink_enum(root, enum_dict)
+    for numeric_type_dict in numeric_type_entries:
+        create_simulink_numeric_type(root, numeric_type_dict)
   
     dict_obj = ET.SubElement(root, "Object", Class="DD.Dictionary")
     ET.SubElement(dict_obj, "P", Name="AccessBaseWorkspace", Class="logical").text = "0"
+    for ref_file in references:
+        create_dd_reference(root, ref_file)
 
-    # Apply indentation to chunk0.xml
-    # ET.indent(root, '  ')
-    # indent(root)
-    chunk0_file = os.path.join(temp_dir, "data", "chunk0.xml")
-    tree = ET.ElementTree(root)
-    # with open(chunk0_file, "wb") as f:
-    tree.write(chunk0_file, encoding="utf-8", xml_declaration=True)
-    xmlDom = minidom.parse(chunk0_file)
-
-    prettyXML = xmlDom.toprettyxml(encoding="UTF-8",indent="  ")
+    chunk_roots = [root]
+    if chunk_size:
+        objects = list(root)
+        chunk_roots = []
+        for i in range(0, len(objects), chunk_size):
+            chunk_root = ET.Element("DataSource", root.attrib)
+            chunk_root.extend(objects[i:i + chunk_size])
+            chunk_roots.append(chunk_root)
+    chunk_names = [f"data/chunk{i}.xml" for i in range(len(chunk_roots))]
 
-    myfile = open(chunk0_file, mode="wb")
-    myfile.write(prettyXML)
-    myfile.close()
-    # Create .sldd file (zipped archive)
-    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.write(os.path.join(temp_dir, "[Content_Types].xml"), "[Content_Types].xml")
-        zf.write(os.path.join(temp_dir, "_rels", ".rels"), "_rels/.rels")
-        zf.write(chunk0_file, "data/chunk0.xml")
+    # Create _rels/.rels
+    relationships = "\n".join(
+        f'    <Relationship Id="rId{i + 1}" Target="{name}" Type="http://schemas.mathworks.com/simulink/2010/relationships/dictionaryChunk"/>'
+        for i, name in enumerate(chunk_names))
+    rels = f'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+{relationships}
+</Relationships>'''
+    # Parse and pretty-print _rels/.rels
+    rels_xml = minidom.parseString(rels)
+    members.append(("_rels/.rels", rels_xml.toprettyxml(indent="  ", newl="\n", encoding="utf-8")))
 
-    # Clean up temporary directory
-    import shutil
-    shutil.rmtree(temp_dir)
+    # Apply indentation to the chunks
+    # ET.indent(root, '  ')
+    # indent(root)
+    for name, chunk_root in zip(chunk_names, chunk_roots):
+        xmlDom = minidom.parseString(ET.tostring(chunk_root, encoding="utf-8", xml_declaration=True))
+        members.append((name, xmlDom.toprettyxml(encoding="UTF-8",indent="  ")))
 
+    # Create .sldd file (zipped archive), chunks are compressed in parallel
+    raw_size, archive_size, seconds = slddzip.write_archive(output_file, members, compression)
+    slddzip.print_archive_report(output_file, compression, raw_size, archive_size, seconds)
+    return raw_size, archive_size, seconds
 
 
+def create_simulink_dd_split(output_file, groups, enum_entries=[], references=[], numeric_type_entries=[], bus_alignments={},
+                             compression="default", chunk_size=None):
+    """
+    Create a top-level Simulink Data Dictionary that references one sub-dictionary per group.
+    
+    Sub-dictionaries are written next to output_file as <name>_<group>.sldd, with the group name made
+    C compatible (and unique) so user supplied names cannot produce invalid paths. Enums and numeric
+    types go to <name>_types.sldd, referenced by every group sub-dictionary so buses can resolve them.
+    Models then load only the sub-dictionaries they reference instead of one flat dictionary.
+    
+    Args:
+        output_file (str): Path to the top-level .sldd file.
+        groups (dict): {group_name: (params_entries, bus_entries)}.
+        enum_entries (list): Dictionaries {enum_name: {int_value: name}}.
+        references (list): Additional dictionaries referenced by every sub-dictionary.
+        numeric_type_entries (list): Dictionaries {type_name: type_dict}.
+        bus_alignments (dict): {bus_name: alignment}, see create_simulink_dd.
+        compression (str): Archive compression of all dictionaries, see create_simulink_dd.
+        chunk_size (int, optional): Maximum number of objects per chunk, see create_simulink_dd.
+    
+    Returns:
+        list: Paths of the written sub-dictionaries.
+    """
+    base, ext = os.path.splitext(output_file)
+    sub_files = []
+    sub_references = list(references)
+    if enum_entries or numeric_type_entries:
+        types_file = f"{base}_types{ext}"
+        create_simulink_dd(types_file, enum_entries=enum_entries, references=references,
+                           numeric_type_entries=numeric_type_entries, compression=compression, chunk_size=chunk_size)
+        sub_files.append(types_file)
+        sub_references.append(types_file)
+    group_names = symbols.SymbolTable(reserved={"types"})
+    for group_name, (params_entries, bus_entries) in groups.items():
+        group_file = f"{base}_{group_names.add(str(group_name), 'group')}{ext}"
+        create_simulink_dd(group_file, params_entries=params_entries, bus_entries=bus_entries,
+                           references=sub_references, bus_alignments=bus_alignments,
+                           compression=compression, chunk_size=chunk_size)
+        sub_files.append(group_file)
+    for line in group_names.report(os.path.basename(output_file)):
+        print(line)
+    create_simulink_dd(output_file, references=sub_files, compression=compression)
+    return sub_files
 
 
 # Example usage
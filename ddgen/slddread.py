@@ -0,0 +1,125 @@
+import xml.etree.ElementTree as ET
+import zipfile
+import numpy as np
+
+ENUM_CLASS = "Simulink.data.dictionary.EnumTypeDefinition"
+
+def get_props(elem):
+    """Map the names of the direct <P> children of an XML element to the elements."""
+    return {p.get("Name"): p for p in elem.findall("P")}
+
+def get_text(props, name, default=""):
+    p = props.get(name)
+    if p is None or p.text is None:
+        return default
+    return p.text
+
+def parse_values(text):
+    """
+    Parse a space separated value list.
+
+    Returns a NumPy float array when all values are numeric (lookup tables parse in one call),
+    else a list keeping the non-numeric values as strings.
+    """
+    parts = text.split()
+    try:
+        return np.array(parts, dtype=float)
+    except ValueError:
+        pass
+    values = []
+    for v in parts:
+        try:
+            values.append(float(v))
+        except ValueError:
+            values.append(v)
+    return values
+
+def parse_dd_entry(obj):
+    """
+    Convert a <Object Class="DD.ENTRY"> XML element to a dictionary.
+
+    Returns:
+        dict: Name, Class and, depending on the class:
+            - Simulink.Bus: Elements (list of dicts with Name, DataType, Dimensions, Description, Units)
+            - EnumTypeDefinition: Enumerals (list of dicts with Name, Value, Description)
+            - parameters: Value, Dimensions, DataType, Min, Max, Units, Description, StorageClass
+            - NumericType: DataType
+    """
+    props = get_props(obj)
+    entry = {"Name": get_text(props, "Name")}
+    value = props.get("Value")
+    elem = value.find("Element") if value is not None else None
+    if elem is None:
+        entry["Class"] = ""
+        return entry
+    entry["Class"] = elem.get("Class", "")
+    props = get_props(elem)
+    if entry["Class"] == "Simulink.Bus":
+        elements = props.get("Elements_internal")
+        entry["Elements"] = []
+        for el in (elements.findall("Element") if elements is not None else []):
+            el_props = get_props(el)
+            entry["Elements"].append({
+                "Name": get_text(el_props, "Name"),
+                "DataType": get_text(el_props, "DataType_internal"),
+                "Dimensions": get_text(el_props, "Dimensions"),
+                "Description": get_text(el_props, "Description"),
+                "Units": get_text(el_props, "DocUnits"),
+            })
+    elif entry["Class"] == ENUM_CLASS:
+        enumerals = props.get("Enumerals")
+        entry["Enumerals"] = []
+        for el in (enumerals.findall("Element") if enumerals is not None else []):
+            el_props = get_props(el)
+            entry["Enumerals"].append({
+                "Name": get_text(el_props, "Name"),
+                "Value": get_text(el_props, "Value"),
+                "Description": get_text(el_props, "Description"),
+            })
+    elif "Value" in props:
+        # Simulink.Parameter and derived classes (EcoObj.Parameter, ...)
+        entry["Value"] = parse_values(get_text(props, "Value"))
+        entry["Dimensions"] = [int(float(d)) for d in get_text(props, "Dimensions").split()]
+        entry["DataType"] = get_text(props, "DataType")
+        entry["Min"] = get_text(props, "Min")
+        entry["Max"] = get_text(props, "Max")
+        entry["Units"] = get_text(props, "DocUnits")
+        entry["Description"] = get_text(props, "Description")
+        entry["StorageClass"] = ""
+        coder_info = props.get("CoderInfo")
+        if coder_info is not None and coder_info.find("Element") is not None:
+            ci_props = get_props(coder_info.find("Element"))
+            storage_class = get_text(ci_props, "StorageClass")
+            if storage_class == "Custom":
+                storage_class = get_text(ci_props, "CustomStorageClass", storage_class)
+            entry["StorageClass"] = storage_class
+    else:
+        entry["DataType"] = get_text(props, "DataTypeMode")
+    return entry
+
+def iter_sldd_entries(sldd_file):
+    """
+    Stream the entries of a .sldd file without building the whole XML tree.
+
+    Every chunk in the archive is parsed incrementally and each DD.ENTRY is
+    released as soon as it has been converted, so memory stays bounded by the
+    largest single entry.
+
+    Args:
+        sldd_file (str): Path to the .sldd file.
+
+    Yields:
+        dict: Entries as returned by parse_dd_entry.
+    """
+    with zipfile.ZipFile(sldd_file) as zf:
+        chunks = sorted(n for n in zf.namelist() if n.startswith("data/") and n.endswith(".xml"))
+        for chunk in chunks:
+            with zf.open(chunk) as f:
+                root = None
+                for event, elem in ET.iterparse(f, events=("start", "end")):
+                    if root is None:
+                        root = elem
+                    if event == "end" and elem.tag == "Object":
+                        if elem.get("Class") == "DD.ENTRY":
+                            yield parse_dd_entry(elem)
+                        root.clear()
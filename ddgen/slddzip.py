@@ -0,0 +1,98 @@
+import os
+import struct
+import time
+import zlib
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Archive compression presets: (zip method, zlib level)
+COMPRESSION = {
+    "stored": (zipfile.ZIP_STORED, None),
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "default": (zipfile.ZIP_DEFLATED, 6),
+    "best": (zipfile.ZIP_DEFLATED, 9),
+}
+ZIP64_LIMIT = 0xFFFFFFFF
+
+def check_compression(compression):
+    """Raise ValueError for an unknown compression, so callers can fail before writing anything."""
+    if compression not in COMPRESSION:
+        raise ValueError(f"Unknown compression: {compression}. Available: {', '.join(COMPRESSION)}")
+
+def compress_member(data, level):
+    """
+    Compress one archive member as raw deflate data (no zlib header, as stored in zip files).
+
+    zlib releases the GIL while compressing, so members compress in parallel in threads.
+
+    Returns:
+        tuple: (crc32, compressed bytes)
+    """
+    crc = zlib.crc32(data)
+    if level is None:
+        return crc, data
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return crc, compressor.compress(data) + compressor.flush()
+
+def dos_date_time(timestamp):
+    t = time.localtime(timestamp)
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_date, dos_time
+
+def write_zip(output_file, members, method, level):
+    """Write pre-compressed members [(arcname, data, crc, compressed)] as a zip archive."""
+    dos_date, dos_time = dos_date_time(time.time())
+    central = []
+    offset = 0
+    with open(output_file, "wb") as f:
+        for arcname, data, crc, compressed in members:
+            name = arcname.encode("utf-8")
+            # General purpose flag 0x800: UTF-8 file name. Deflate level hint in bits 1-2 (fast/best)
+            flags = 0x800 | {1: 0x4, 9: 0x2}.get(level, 0)
+            header = struct.pack("<4s5H3L2H", b"PK\x03\x04", 20, flags, method, dos_time, dos_date,
+                                 crc, len(compressed), len(data), len(name), 0)
+            f.write(header + name)
+            f.write(compressed)
+            central.append(struct.pack("<4s6H3L5H2L", b"PK\x01\x02", 20, 20, flags, method, dos_time, dos_date,
+                                       crc, len(compressed), len(data), len(name), 0, 0, 0, 0, 0, offset) + name)
+            offset += len(header) + len(name) + len(compressed)
+        central_dir = b"".join(central)
+        f.write(central_dir)
+        f.write(struct.pack("<4s4H2LH", b"PK\x05\x06", 0, 0, len(members), len(members),
+                            len(central_dir), offset, 0))
+
+def write_archive(output_file, members, compression="default", workers=None):
+    """
+    Write a .sldd archive, compressing the members in parallel worker threads.
+
+    Args:
+        output_file (str): Path to the archive.
+        members (list): Tuples (arcname, bytes) in archive order.
+        compression (str): Key of COMPRESSION: stored, fast, default or best.
+        workers (int, optional): Number of compression threads, defaults to one per member up to the CPU count.
+
+    Returns:
+        tuple: (raw_size, archive_size, seconds)
+    """
+    check_compression(compression)
+    method, level = COMPRESSION[compression]
+    start = time.perf_counter()
+    raw_size = sum(len(data) for _, data in members)
+    if raw_size >= ZIP64_LIMIT:
+        # Too large for the plain zip format: let zipfile write the Zip64 records
+        with zipfile.ZipFile(output_file, "w", method, compresslevel=level, allowZip64=True) as zf:
+            for arcname, data in members:
+                zf.writestr(arcname, data)
+    else:
+        workers = workers or min(len(members), os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda member: compress_member(member[1], level), members))
+        write_zip(output_file, [(arcname, data, crc, compressed)
+                                for (arcname, data), (crc, compressed) in zip(members, results)], method, level)
+    return raw_size, os.path.getsize(output_file), time.perf_counter() - start
+
+def print_archive_report(output_file, compression, raw_size, archive_size, seconds):
+    ratio = 100.0 * archive_size / raw_size if raw_size else 100.0
+    print(f"{os.path.basename(output_file)}: {compression} compression, {raw_size} -> {archive_size} bytes "
+          f"({ratio:.1f}%) in {seconds:.2f} s")
@@ -0,0 +1,87 @@
+import re
+from functools import lru_cache
+
+C_KEYWORDS = {
+    "auto", "break", "case", "char", "const", "continue", "default", "do", "double", "else", "enum",
+    "extern", "float", "for", "goto", "if", "inline", "int", "long", "register", "restrict", "return",
+    "short", "signed", "sizeof", "static", "struct", "switch", "typedef", "union", "unsigned", "void",
+    "volatile", "while", "_Bool", "_Complex", "_Imaginary", "_Alignas", "_Alignof", "_Atomic",
+    "_Generic", "_Noreturn", "_Static_assert", "_Thread_local", "bool", "true", "false", "NULL",
+}
+MATLAB_KEYWORDS = {
+    "break", "case", "catch", "classdef", "continue", "else", "elseif", "end", "for", "function",
+    "global", "if", "otherwise", "parfor", "persistent", "return", "spmd", "switch", "try", "while",
+}
+# Simulink built-in data types and the rtwtypes.h typedefs used by generated code
+SIMULINK_RESERVED = {
+    "boolean", "int8", "uint8", "int16", "uint16", "int32", "uint32", "int64", "uint64", "single",
+    "double", "half", "string", "fixdt", "Inf", "NaN", "pi", "eps",
+    "boolean_T", "int8_T", "uint8_T", "int16_T", "uint16_T", "int32_T", "uint32_T", "int64_T",
+    "uint64_T", "real32_T", "real64_T", "real_T", "time_T", "char_T", "uchar_T", "byte_T",
+    "int_T", "uint_T", "ulong_T", "creal_T", "pointer_T",
+}
+RESERVED = frozenset(C_KEYWORDS | MATLAB_KEYWORDS | SIMULINK_RESERVED)
+
+_NON_C_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+@lru_cache(maxsize=None)
+def make_c_compatible(name):
+    """Replace any non-alphanumeric or underscore character with underscore, prefix names starting with a digit."""
+    new_name = _NON_C_CHARS.sub('_', name)
+    if new_name[:1].isdigit():
+        new_name = 'E_' + new_name
+    return new_name
+
+class SymbolTable:
+    """
+    Names of one namespace (dictionary entries, elements of one bus, values of one enum).
+
+    Every added name is sanitized with make_c_compatible and checked against the
+    names already in the table and the reserved words in a single hash lookup.
+    A colliding name gets the first free suffix _1, _2, ... so the result only
+    depends on the order the names are added.
+    """
+
+    def __init__(self, reserved=RESERVED):
+        self.reserved = reserved
+        self.names = {}  # resolved name -> (original name, kind)
+        self.collisions = []  # (kind, original name, resolved name, reason)
+        self._next_suffix = {}  # sanitized name -> next suffix to try
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def add(self, name, kind=""):
+        """
+        Register a new symbol.
+
+        Args:
+            name (str): Original name.
+            kind (str): Symbol kind used in the collision report (bus, enum, param, ...).
+
+        Returns:
+            str: The unique C compatible name to use.
+        """
+        base = make_c_compatible(name)
+        resolved = base
+        if resolved in self.names or resolved in self.reserved:
+            n = self._next_suffix.get(base, 1)
+            resolved = f"{base}_{n}"
+            while resolved in self.names or resolved in self.reserved:
+                n += 1
+                resolved = f"{base}_{n}"
+            self._next_suffix[base] = n + 1
+            if base in self.reserved:
+                reason = "reserved word"
+            else:
+                other, other_kind = self.names[base]
+                reason = f"collides with {other_kind or 'symbol'} '{other}'"
+            self.collisions.append((kind, name, resolved, reason))
+        self.names[resolved] = (name, kind)
+        return resolved
+
+    def report(self, scope=""):
+        """Lines describing the renamed symbols."""
+        prefix = f"{scope}: " if scope else ""
+        return [f"{prefix}{kind} '{name}' renamed to '{resolved}' ({reason})"
+                for kind, name, resolved, reason in self.collisions]
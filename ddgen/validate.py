@@ -0,0 +1,172 @@
+import re
+import numpy as np
+import pandas as pd
+
+BUILTIN_TYPES = {
+    "boolean", "int8", "uint8", "int16", "uint16", "int32", "uint32", "int64", "uint64",
+    "single", "double", "half", "string",
+}
+REQUIRED_PARAM_FIELDS = ["Name", "Dimensions", "Value", "Units"]
+REQUIRED_BUS_ELEMENT_FIELDS = ["Name", "DataType", "Dimensions"]
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_FIXDT = re.compile(r"fixdt\(\s*[01]\s*,\s*\d+\s*(,\s*[-+0-9.eE]+\s*){1,2}\)")
+
+class ValidationError(ValueError):
+    """Raised when a model does not pass validation, errors holds the full report."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} validation error(s)")
+
+def known_type_checker(model, referenced=()):
+    """Return a function telling whether a data type name is valid in the model or the models it references."""
+    models = [model] + list(referenced)
+    enums = {name for m in models for enum_dict in m["enums"] for name in enum_dict}
+    buses = {name for m in models for name, _ in m["buses"]}
+    numeric_types = {name for m in models for numeric_type_dict in m["numeric_types"] for name in numeric_type_dict}
+
+    def is_known(data_type):
+        if data_type in BUILTIN_TYPES or data_type in numeric_types or _FIXDT.fullmatch(data_type):
+            return True
+        if data_type.startswith("Enum: "):
+            return data_type[len("Enum: "):] in enums
+        if data_type.startswith("Bus: "):
+            return data_type[len("Bus: "):] in buses
+        return False
+    return is_known
+
+def is_missing(value):
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+def to_float_array(values):
+    try:
+        return np.asarray(values, dtype=float).ravel()
+    except (TypeError, ValueError):
+        return np.array([np.nan] * len(values))
+
+def dimensions_error(dims):
+    """Error message for parameter Dimensions, None if they are two positive integers."""
+    if is_missing(dims):
+        return "missing Dimensions"
+    if not isinstance(dims, (list, tuple, np.ndarray)) or len(dims) != 2:
+        return "Dimensions must be a list of two integers"
+    if any(is_missing(d) for d in dims):
+        return "missing Dimensions"
+    dims = to_float_array(dims)
+    if np.isnan(dims).any() or (dims != np.round(dims)).any():
+        return f"Dimensions must be integers, got {' x '.join(f'{d:g}' for d in dims)}"
+    if (dims < 1).any():
+        return f"Dimensions must be positive, got {' x '.join(f'{d:g}' for d in dims)}"
+    return None
+
+def validate_params(params, is_known):
+    """
+    Check all parameters in one pass over column arrays.
+
+    Returns:
+        list: Tuples (kind, name, message).
+    """
+    if not params:
+        return []
+    errors = []
+    df = pd.DataFrame(params)
+    names = df["Name"].astype(str).values if "Name" in df else np.array([f"#{i}" for i in range(len(df))])
+
+    for field in REQUIRED_PARAM_FIELDS:
+        missing = df[field].map(is_missing).values if field in df else np.ones(len(df), dtype=bool)
+        errors += [("param", names[i], f"missing {field}") for i in np.flatnonzero(missing)]
+
+    if "Dimensions" in df and "Value" in df:
+        dims_errors = [dimensions_error(d) for d in df["Dimensions"]]
+        errors += [("param", names[i], dims_errors[i]) for i in range(len(df))
+                   if dims_errors[i] and not is_missing(df["Dimensions"].iloc[i])]
+        # Dimensions as float arrays, NaN where they are invalid so the value count is not checked
+        valid = np.array([e is None for e in dims_errors])
+        dims = [to_float_array(d) if ok else np.array([np.nan, np.nan]) for d, ok in zip(df["Dimensions"], valid)]
+        rows = np.array([d[0] for d in dims])
+        cols = np.array([d[1] for d in dims])
+        values = [to_float_array(v) if not is_missing(v) else np.array([]) for v in df["Value"]]
+        counts = np.array([len(v) for v in values])
+        bad_count = ~np.isnan(rows * cols) & (rows * cols != counts)
+        errors += [("param", names[i], f"{counts[i]} values do not match dimensions {int(rows[i])}*{int(cols[i])}")
+                   for i in np.flatnonzero(bad_count)]
+
+        # Value checks on one flat array of all values
+        flat = np.concatenate(values) if values else np.array([])
+        owner = np.repeat(np.arange(len(values)), counts)
+        nan_values = np.unique(owner[np.isnan(flat)])
+        errors += [("param", names[i], "value is NaN or not numeric") for i in nan_values if counts[i]]
+        mins = pd.to_numeric(df["Min"], errors="coerce").values if "Min" in df else np.zeros(len(df))
+        maxs = pd.to_numeric(df["Max"], errors="coerce").values if "Max" in df else np.full(len(df), 100.0)
+        errors += [("param", names[i], f"Min {mins[i]} > Max {maxs[i]}") for i in np.flatnonzero(mins > maxs)]
+        out_of_range = (flat < mins[owner]) | (flat > maxs[owner])
+        errors += [("param", names[i], f"value outside [{mins[i]}, {maxs[i]}]") for i in np.unique(owner[out_of_range])]
+
+    if "DataType" in df:
+        data_types = df["DataType"]
+        bad_type = ~data_types.map(lambda t: t is None or t == "" or (isinstance(t, str) and is_known(t))).values
+        errors += [("param", names[i], f"unknown DataType '{data_types.iloc[i]}'") for i in np.flatnonzero(bad_type)]
+    return errors
+
+def validate_buses(buses, is_known):
+    errors = []
+    for bus_name, elements in buses:
+        seen = set()
+        for el in elements:
+            el_name = el.get("Name")
+            name = f"{bus_name}.{el_name}"
+            for field in REQUIRED_BUS_ELEMENT_FIELDS:
+                if is_missing(el.get(field)) or el.get(field) == "":
+                    errors.append(("bus element", name, f"missing {field}"))
+            if el_name in seen:
+                errors.append(("bus element", name, "duplicate element name"))
+            seen.add(el_name)
+            if isinstance(el.get("DataType"), str) and el["DataType"] and not is_known(el["DataType"]):
+                errors.append(("bus element", name, f"unknown DataType '{el['DataType']}'"))
+            try:
+                if int(el.get("Dimensions")) < 1:
+                    errors.append(("bus element", name, "Dimensions must be positive"))
+            except (TypeError, ValueError):
+                if not is_missing(el.get("Dimensions")):
+                    errors.append(("bus element", name, f"invalid Dimensions '{el.get('Dimensions')}'"))
+    return errors
+
+def validate_enums(enums):
+    errors = []
+    for enum_dict in enums:
+        for enum_name, enum_table in enum_dict.items():
+            if not enum_table:
+                errors.append(("enum", enum_name, "no values"))
+                continue
+            seen = set()
+            for value, value_name in enum_table.items():
+                if not isinstance(value, (int, np.integer)):
+                    errors.append(("enum", enum_name, f"value {value!r} is not an integer"))
+                if not isinstance(value_name, str) or not _IDENTIFIER.fullmatch(value_name):
+                    errors.append(("enum", enum_name, f"invalid value name {value_name!r}"))
+                elif value_name in seen:
+                    errors.append(("enum", enum_name, f"duplicate value name '{value_name}'"))
+                seen.add(value_name)
+    return errors
+
+def validate_model(model, referenced=()):
+    """
+    Check every parameter, bus element and enum of a model (see emitters.new_model) against the schema:
+    required fields, dimension/value-count agreement, Min <= value <= Max and valid type names.
+
+    Args:
+        model (dict): See emitters.new_model.
+        referenced (list): Models of referenced dictionaries; their types resolve names but are not checked.
+
+    Returns:
+        list: All errors as tuples (kind, name, message), empty if the model is valid.
+    """
+    is_known = known_type_checker(model, referenced)
+    return validate_params(model["params"], is_known) + validate_buses(model["buses"], is_known) + validate_enums(model["enums"])
+
+def print_report(errors, source=""):
+    prefix = f"{source}: " if source else ""
+    for kind, name, message in errors:
+        print(f"{prefix}{kind} '{name}': {message}")
+    print(f"{prefix}{len(errors)} validation error(s)" if errors else f"{prefix}validation passed")
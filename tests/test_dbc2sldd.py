@@ -0,0 +1,126 @@
+# tests/test_dbc2sldd.py
+
+import os
+import shutil
+from types import SimpleNamespace
+
+import pytest
+
+from ddgen import dbc2sldd, slddgen
+
+EXAMPLE_DBC = os.path.join(os.path.dirname(__file__), "..", "data", "example.dbc")
+
+def signal(size, is_signed=False, factor=1, offset=0, min=0, max=0):
+    return SimpleNamespace(size=size, is_signed=is_signed, factor=factor, offset=offset, min=min, max=max, values={})
+
+def test_propose_data_types_by_range():
+    signals = [
+        signal(8),                          # uint8
+        signal(12),                         # uint16
+        signal(8, is_signed=True),          # int8
+        signal(16, is_signed=True),         # int16
+        signal(8, factor=-1),               # [-255, 0]
+        signal(8, offset=-40),              # [-40, 215]
+        signal(16, min=0, max=200),         # narrowed by the DBC limits
+        signal(16, factor=0.1),             # not integral
+        signal(1),
+    ]
+    assert dbc2sldd.propose_data_types_by_range(signals) == [
+        "uint8", "uint16", "int8", "int16", "int16", "int16", "uint8", "single", "boolean",
+    ]
+
+def test_signal_ranges():
+    phys_min, phys_max, is_integral = dbc2sldd.signal_ranges([signal(8, offset=-40), signal(4, factor=0.5)])
+    assert phys_min.tolist() == [-40.0, 0.0]
+    assert phys_max.tolist() == [215.0, 7.5]
+    assert is_integral.tolist() == [True, False]
+
+def test_propose_fixdt():
+    assert dbc2sldd.propose_fixdt(signal(16, factor=0.125)) == "fixdt(0,16,3)"
+    assert dbc2sldd.propose_fixdt(signal(8, is_signed=True, factor=4)) == "fixdt(1,8,-2)"
+    assert dbc2sldd.propose_fixdt(signal(12, factor=0.1, offset=-40)) == "fixdt(0,16,0.1,-40.0)"
+    # approx rounds the slope up to a power of two and keeps the word length
+    assert dbc2sldd.propose_fixdt(signal(16, factor=0.1), "approx") == "fixdt(0,16,3)"
+    assert dbc2sldd.propose_fixdt(signal(16, factor=-1)) is None
+
+def test_extract_numeric_types():
+    elements = [{"Name": n, "DataType": t} for n, t in [
+        ("a", "fixdt(1,16,4)"), ("b", "fixdt(1,8,-2)"), ("c", "fixdt(0,16,0.1,-40.0)"), ("d", "fixdt(1,16,4)"), ("e", "uint8")]]
+    numeric_types = dbc2sldd.extract_numeric_types([("Bus", elements)])
+    assert [el["DataType"] for el in elements] == ["sfix16_En4", "sfix8_E2", "ufix16_S0p1_Bn40p0", "sfix16_En4", "uint8"]
+    assert [list(t) for t in numeric_types] == [["sfix16_En4"], ["sfix8_E2"], ["ufix16_S0p1_Bn40p0"]]
+    assert numeric_types[0]["sfix16_En4"]["Slope"] == 2.0 ** -4
+    assert numeric_types[2]["ufix16_S0p1_Bn40p0"]["Bias"] == -40.0
+
+def test_create_numeric_type_entry_value():
+    def props(type_dict):
+        return {p.get("Name"): p.text for p in slddgen.create_numeric_type_entry_value(type_dict).findall("P")}
+    binary_point = props({"Signed": True, "WordLength": 16, "Slope": 2.0 ** -4, "Bias": 0.0})
+    assert binary_point["DataTypeMode"] == "Fixed-point: binary point scaling"
+    assert binary_point["FractionLength"] == "4.0"
+    # 0.1 = 1.6 * 2^-4
+    slope_bias = props({"Signed": False, "WordLength": 16, "Slope": 0.1, "Bias": -40.0})
+    assert slope_bias["DataTypeMode"] == "Fixed-point: slope and bias scaling"
+    assert float(slope_bias["SlopeAdjustmentFactor"]) == 1.6
+    assert slope_bias["FixedExponent"] == "-4.0"
+    assert slope_bias["Bias"] == "-40.0"
+
+def test_unknown_fixdt_scaling_is_rejected():
+    with pytest.raises(ValueError, match="Unknown fixdt scaling: exat"):
+        dbc2sldd.create_bus_entries_from_dbc(EXAMPLE_DBC, fixdt="exat")
+    with pytest.raises(ValueError, match="Unknown fixdt scaling: fast"):
+        dbc2sldd.create_bus_entries_from_dbc(EXAMPLE_DBC, fixdt={"default": "exact", "EC_Status_1": "fast"})
+
+def test_group_bus_entries_uses_original_message_names():
+    bus_entries = [("CAN_MSG_EC_Status_1_t", []), ("CAN_MSG_EC_Status_1_t_1", []), ("CAN_MSG_E_2Speed_t", [])]
+    bus_messages = {
+        "CAN_MSG_EC_Status_1_t": ("EC_Status_1", ["EC"]),
+        "CAN_MSG_EC_Status_1_t_1": ("EC_Status_1", ["EC"]),   # renamed by the symbol table
+        "CAN_MSG_E_2Speed_t": ("2Speed", ["AC", "EC"]),        # sanitized name
+    }
+    by_node = dbc2sldd.group_bus_entries(bus_entries, "node", bus_messages)
+    assert {group: [name for name, _ in buses] for group, buses in by_node.items()} == {
+        "EC": ["CAN_MSG_EC_Status_1_t", "CAN_MSG_EC_Status_1_t_1"], "AC_EC": ["CAN_MSG_E_2Speed_t"]}
+    by_pattern = dbc2sldd.group_bus_entries(bus_entries, {"speed": r"\dSpeed", "ec": r"EC_"}, bus_messages)
+    assert {group: [name for name, _ in buses] for group, buses in by_pattern.items()} == {
+        "ec": ["CAN_MSG_EC_Status_1_t", "CAN_MSG_EC_Status_1_t_1"], "speed": ["CAN_MSG_E_2Speed_t"]}
+
+def test_split_shared_entries():
+    def bus(name, data_type):
+        return (name, [{"Name": "Sig", "DataType": data_type, "Dimensions": 1}])
+    gear = {"Gear_enum": {0: "Park", 1: "Drive"}}
+    dbc_entries = {
+        "a.dbc": ([bus("Speed", "uint8"), bus("Gear", "Enum: Gear_enum"), bus("Mode", "Enum: Mode_enum"),
+                   bus("Status", "uint8")],
+                  [gear, {"Mode_enum": {0: "Off"}}]),
+        "b.dbc": ([bus("Speed", "uint8"), bus("Gear", "Enum: Gear_enum"), bus("Mode", "Enum: Mode_enum")],
+                  [gear, {"Mode_enum": {0: "Off", 1: "On"}}]),
+        "c.dbc": ([bus("Status", "uint16"), bus("Only", "uint8")], []),
+    }
+    common_buses, common_enums, unique_entries, conflicts = dbc2sldd.split_shared_entries(dbc_entries)
+    assert [name for name, _ in common_buses] == ["Speed", "Gear"]
+    assert common_enums == [gear]
+    # Mode uses a conflicting enum, so it stays in both DBC dictionaries
+    assert {f: ([name for name, _ in buses], [list(e)[0] for e in enums]) for f, (buses, enums) in unique_entries.items()} == {
+        "a.dbc": (["Mode", "Status"], ["Mode_enum"]),
+        "b.dbc": (["Mode"], ["Mode_enum"]),
+        "c.dbc": (["Status", "Only"], []),
+    }
+    assert [(kind, name, sorted(files for files in hashes.values())) for kind, name, hashes in conflicts] == [
+        ("enum", "Mode_enum", [["a.dbc"], ["b.dbc"]]),
+        ("bus", "Status", [["a.dbc"], ["c.dbc"]]),
+    ]
+
+def test_unknown_compression_writes_nothing(tmp_path):
+    shutil.copy(EXAMPLE_DBC, tmp_path / "example.dbc")
+    with pytest.raises(ValueError, match="Unknown compression: zip"):
+        dbc2sldd.dbc2sldd_gen(str(tmp_path / "example.dbc"), targets=("m", "h", "sldd"), compression="zip")
+    assert os.listdir(tmp_path) == ["example.dbc"]
+
+def test_split_group_names_are_safe_file_names(tmp_path):
+    groups = {"A/B": ([], [("Bus1", [{"Name": "Sig", "DataType": "uint8", "Dimensions": 1}])]),
+              "A B": ([], [("Bus2", [{"Name": "Sig", "DataType": "uint8", "Dimensions": 1}])]),
+              "types": ([], [])}
+    sub_files = slddgen.create_simulink_dd_split(str(tmp_path / "dd.sldd"), groups)
+    assert [os.path.basename(f) for f in sub_files] == ["dd_A_B.sldd", "dd_A_B_1.sldd", "dd_types_1.sldd"]
+    assert sorted(os.listdir(tmp_path)) == ["dd.sldd", "dd_A_B.sldd", "dd_A_B_1.sldd", "dd_types_1.sldd"]
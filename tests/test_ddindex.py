@@ -0,0 +1,70 @@
+# tests/test_ddindex.py
+
+import os
+import shutil
+
+from ddgen import ddindex, slddgen, slddread
+
+EXAMPLE_DBC = os.path.join(os.path.dirname(__file__), "..", "data", "example.dbc")
+
+def make_sldd(path):
+    slddgen.create_simulink_dd(
+        str(path),
+        params_entries=[{"Name": "EC1_Gain", "Dimensions": [1, 2], "Value": [1.5, 2.0], "Units": "rpm",
+                         "DataType": "double", "Min": 0, "Max": 10}],
+        bus_entries=[("CAN_MSG_EC1_t", [{"Name": "EC1_Speed", "DataType": "uint16", "Dimensions": 1, "Units": "rpm"},
+                                        {"Name": "Gear", "DataType": "Enum: Gear_enum", "Dimensions": 1}])],
+        enum_entries=[{"Gear_enum": {0: "Park", 1: "Drive"}}],
+    )
+
+def test_iter_sldd_entries(tmp_path):
+    make_sldd(tmp_path / "a.sldd")
+    entries = {e["Name"]: e for e in slddread.iter_sldd_entries(str(tmp_path / "a.sldd"))}
+    assert set(entries) == {"EC1_Gain", "CAN_MSG_EC1_t", "Gear_enum"}
+    assert entries["EC1_Gain"]["Value"].tolist() == [1.5, 2.0]
+    assert entries["EC1_Gain"]["Dimensions"] == [1, 2]
+    assert [el["Name"] for el in entries["CAN_MSG_EC1_t"]["Elements"]] == ["EC1_Speed", "Gear"]
+    assert [(el["Name"], el["Value"]) for el in entries["Gear_enum"]["Enumerals"]] == [("Park", "0"), ("Drive", "1")]
+
+def test_update_index_is_incremental(tmp_path, monkeypatch):
+    sldd_dir = tmp_path / "dd"
+    sldd_dir.mkdir()
+    make_sldd(sldd_dir / "a.sldd")
+    make_sldd(sldd_dir / "b.sldd")
+    db = str(tmp_path / "index.sqlite")
+    assert ddindex.update_index([str(sldd_dir)], db) == (2, 0, 0)
+    assert ddindex.update_index([str(sldd_dir)], db) == (0, 2, 0)
+
+    # New mtime, same content: the hash matches and the file is not parsed again
+    def fail(path):
+        raise AssertionError(f"{path} parsed again")
+    monkeypatch.setattr(ddindex, "rows_from_sldd", fail)
+    stat = os.stat(sldd_dir / "a.sldd")
+    os.utime(sldd_dir / "a.sldd", (stat.st_atime, stat.st_mtime + 10))
+    assert ddindex.update_index([str(sldd_dir)], db) == (0, 2, 0)
+
+    os.remove(sldd_dir / "b.sldd")
+    assert ddindex.update_index([str(sldd_dir)], db) == (0, 1, 1)
+    assert {os.path.basename(row[4]) for row in ddindex.query_index("EC1_Gain", db)} == {"a.sldd"}
+
+def test_query_index(tmp_path):
+    make_sldd(tmp_path / "a.sldd")
+    db = str(tmp_path / "index.sqlite")
+    ddindex.update_index([str(tmp_path)], db)
+    assert [row[:4] for row in ddindex.query_index("EC1_Gain", db)] == [("param", "EC1_Gain", "double", "")]
+    assert [row[:4] for row in ddindex.query_index("EC1_*", db)] == [
+        ("param", "EC1_Gain", "double", ""), ("signal", "EC1_Speed", "uint16", "CAN_MSG_EC1_t")]
+    assert [row[:4] for row in ddindex.query_index("*", db, kind="enum value")] == [
+        ("enum value", "Drive", "1", "Gear_enum"), ("enum value", "Park", "0", "Gear_enum")]
+    assert ddindex.query_index("EC1_Speed", db, kind="bus") == []
+
+def test_dbc_rows_use_numeric_type_names(tmp_path):
+    shutil.copy(EXAMPLE_DBC, tmp_path / "example.dbc")
+    (tmp_path / "generate.yml").write_text("- example.dbc:\n    fixdt: exact\n")
+    db = str(tmp_path / "index.sqlite")
+    ddindex.update_index([str(tmp_path / "example.dbc")], db)
+    signal_types = {row[2] for row in ddindex.query_index("*", db, kind="signal")}
+    type_rows = {row[1]: row[2] for row in ddindex.query_index("*", db, kind="type")}
+    assert not any(t.startswith("fixdt(") for t in signal_types)
+    assert type_rows and set(type_rows) <= signal_types
+    assert all(mode.startswith("Fixed-point") for mode in type_rows.values())
@@ -0,0 +1,11 @@
+# tests/test_emitters.py
+
+from ddgen import emitters
+
+def test_m_str_keeps_literals_on_one_line():
+    assert emitters.m_str("it's") == "'it''s'"
+    assert emitters.m_str("1=on\r\n0=off") == "['1=on' char(10) '0=off']"
+    assert emitters.m_str(None) == "''"
+
+def test_c_comment_cannot_close_comment():
+    assert emitters.c_comment("a */ b\nc") == "a * / b c"
@@ -0,0 +1,21 @@
+# tests/test_layout.py
+
+from ddgen import layout
+
+def test_pack_bus_entries_removes_padding():
+    elements = [
+        {"Name": "IsMsgAvl", "DataType": "boolean", "Dimensions": 1},
+        {"Name": "Speed", "DataType": "single", "Dimensions": 1},
+        {"Name": "Mode", "DataType": "uint8", "Dimensions": 1},
+        {"Name": "Count", "DataType": "uint16", "Dimensions": 1},
+    ]
+    assert layout.struct_layout(elements) == (12, 4, 4)
+    packed, alignments, report = layout.pack_bus_entries([("Bus", elements)])
+    assert [el["Name"] for el in packed[0][1]] == ["Speed", "Count", "IsMsgAvl", "Mode"]
+    assert alignments == {"Bus": 4}
+    assert report == [("Bus", 12, 8, 4, 0)]
+
+def test_fixdt_and_enum_sizes():
+    assert layout.data_type_size("fixdt(1,16,0.1,-40.0)") == 2
+    assert layout.data_type_size("ufix32_S0p1_B0p0") == 4
+    assert layout.data_type_size("Enum: Gear_enum") == 4
@@ -0,0 +1,44 @@
+# tests/test_slddexport.py
+
+import csv
+
+import pytest
+
+from ddgen import slddexport, slddgen
+
+def make_sldd(path):
+    slddgen.create_simulink_dd(
+        str(path),
+        params_entries=[{"Name": "Map", "Dimensions": [2, 3], "Value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.5], "Units": "Nm",
+                         "DataType": "single", "Min": 0, "Max": 10, "Description": "map"}],
+        bus_entries=[("Bus", [{"Name": "Speed", "DataType": "uint16", "Dimensions": 1, "Units": "rpm",
+                               "Description": "speed"}])],
+        enum_entries=[{"Gear_enum": {0: "Park", 1: "Drive"}}],
+    )
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+def test_export_csv(tmp_path):
+    make_sldd(tmp_path / "dd.sldd")
+    paths = slddexport.export_sldd(str(tmp_path / "dd.sldd"), fmt="csv")
+    assert paths == [str(tmp_path / f"dd_{table}.csv") for table in ("params", "bus_elements", "enum_values")]
+    params, bus_elements, enum_values = map(read_csv, paths)
+    assert params[0] == slddexport.PARAM_COLUMNS
+    assert params[1][:3] == ["Map", "2", "3"]
+    assert params[1][3] == "single"
+    assert params[1][-1] == "1.0 2.0 3.0 4.0 5.0 6.5"
+    assert bus_elements == [slddexport.BUS_ELEMENT_COLUMNS, ["Bus", "Speed", "uint16", "1", "rpm", "speed"]]
+    assert [row[:3] for row in enum_values[1:]] == [["Gear_enum", "Park", "0"], ["Gear_enum", "Drive", "1"]]
+
+def test_export_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    make_sldd(tmp_path / "dd.sldd")
+    paths = slddexport.export_sldd(str(tmp_path / "dd.sldd"), str(tmp_path), fmt="parquet")
+    params = pq.read_table(paths[0])
+    assert params.schema.field("Value").type == pa.list_(pa.float64())
+    assert params.column("Value").to_pylist() == [[1.0, 2.0, 3.0, 4.0, 5.0, 6.5]]
+    assert params.column("Name").to_pylist() == ["Map"]
+    assert pq.read_table(paths[1]).column("Name").to_pylist() == ["Speed"]
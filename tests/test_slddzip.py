@@ -0,0 +1,19 @@
+# tests/test_slddzip.py
+
+import zipfile
+
+from ddgen import slddzip
+
+def test_write_archive_round_trip(tmp_path):
+    members = [("[Content_Types].xml", b"<Types/>"),
+               ("data/chunk0.xml", b"<DataSource>" + b"<Object/>" * 1000 + b"</DataSource>"),
+               ("data/chunk1.xml", "<DataSource>é</DataSource>".encode("utf-8"))]
+    sizes = {}
+    for compression in slddzip.COMPRESSION:
+        path = tmp_path / f"{compression}.sldd"
+        raw_size, sizes[compression], _ = slddzip.write_archive(str(path), members, compression)
+        assert raw_size == sum(len(data) for _, data in members)
+        with zipfile.ZipFile(path) as zf:
+            assert zf.testzip() is None
+            assert [(name, zf.read(name)) for name in zf.namelist()] == members
+    assert sizes["best"] <= sizes["fast"] < sizes["stored"]
@@ -0,0 +1,20 @@
+# tests/test_symbols.py
+
+from ddgen import symbols
+
+def test_make_c_compatible():
+    assert symbols.make_c_compatible("A-B") == "A_B"
+    assert symbols.make_c_compatible("1st value") == "E_1st_value"
+
+def test_collisions_are_resolved_in_order():
+    table = symbols.SymbolTable()
+    assert table.add("A_B", "enum") == "A_B"
+    assert table.add("A-B", "bus") == "A_B_1"
+    assert table.add("A B", "param") == "A_B_2"
+    assert [c[2] for c in table.collisions] == ["A_B_1", "A_B_2"]
+
+def test_reserved_words():
+    table = symbols.SymbolTable()
+    assert table.add("int", "signal") == "int_1"
+    assert table.add("uint8", "enum value") == "uint8_1"
+    assert table.collisions[0][3] == "reserved word"
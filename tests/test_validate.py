@@ -0,0 +1,74 @@
+# tests/test_validate.py
+
+import os
+
+import pandas as pd
+
+from ddgen import emitters, pars2sldd, symbols, validate
+
+def param(name, dims, value, units="-", min_=0, max_=100, data_type="double"):
+    return {"Name": name, "Dimensions": dims, "Value": value, "Units": units,
+            "Min": min_, "Max": max_, "DataType": data_type}
+
+def test_validate_model_reports_all_errors():
+    model = emitters.new_model(
+        params=[
+            param("Ok", [1, 2], [1.0, 2.0]),
+            param("WrongCount", [2, 2], [1.0, 2.0, 3.0]),
+            param("NoUnits", [1, 1], [1.0], units=float("nan")),
+            param("OutOfRange", [1, 1], [200.0]),
+            param("BadType", [1, 1], [1.0], data_type="Enum: Missing_enum"),
+        ],
+        buses=[("Bus", [{"Name": "Sig", "DataType": "uint8", "Dimensions": 1},
+                        {"Name": "Sig", "DataType": "ufix16_En3", "Dimensions": 1}])],
+        enums=[{"Gear_enum": {0: "Park", 1: "Park"}}],
+    )
+    errors = validate.validate_model(model)
+    assert {(kind, name) for kind, name, _ in errors} == {
+        ("param", "WrongCount"), ("param", "NoUnits"), ("param", "OutOfRange"), ("param", "BadType"),
+        ("bus element", "Bus.Sig"), ("enum", "Gear_enum"),
+    }
+
+def test_validate_model_accepts_known_types():
+    model = emitters.new_model(
+        params=[param("Gear", [1, 1], [1], data_type="Enum: Gear_enum")],
+        buses=[("Bus", [{"Name": "Sig", "DataType": "ufix16_En3", "Dimensions": 1}])],
+        enums=[{"Gear_enum": {0: "Park", 1: "Drive"}}],
+        numeric_types=[{"ufix16_En3": {"Signed": False, "WordLength": 16, "Slope": 0.125, "Bias": 0.0}}],
+    )
+    assert validate.validate_model(model) == []
+
+def test_validate_model_reports_invalid_dimensions():
+    model = emitters.new_model(params=[
+        param("EmptyRows", [float("nan"), 10], []),
+        param("NoColumns", [None, None], []),
+        param("Fraction", [1.5, 2], [1.0, 2.0, 3.0]),
+        param("Negative", [-1, 1], [1.0]),
+    ])
+    assert validate.validate_model(model) == [
+        ("param", "EmptyRows", "missing Dimensions"),
+        ("param", "NoColumns", "missing Dimensions"),
+        ("param", "Fraction", "Dimensions must be integers, got 1.5 x 2"),
+        ("param", "Negative", "Dimensions must be positive, got -1 x 1"),
+    ]
+
+def test_empty_data_type_cell_is_inferred(tmp_path):
+    df = pd.DataFrame({"Name": ["Gain"], "Dimensions_1": [1], "Dimensions_2": [1], "Value_1": [2.5], "Unit": ["-"],
+                       "Description": ["d"], "DataType": [float("nan")], "Min": [0], "Max": [10]})
+    ElementClass, coder_info = pars2sldd.get_coder_info("import_from_file")
+    params = pars2sldd.create_pars_entries_from_df(df, ElementClass, coder_info, symbols.SymbolTable())
+    assert params[0]["DataType"] is None
+    model = emitters.new_model(params=params)
+    assert validate.validate_model(model) == []
+    paths = emitters.emit_all(str(tmp_path / "pars"), model, ["sldd", "m", "h"])
+    assert all(os.path.exists(p) for p in paths)
+    # A NaN reaching the model without the workbook conversion is an error, not a silent default
+    model = emitters.new_model(params=[param("Gain", [1, 1], [2.5], data_type=float("nan"))])
+    assert validate.validate_model(model) == [("param", "Gain", "unknown DataType 'nan'")]
+
+def test_validate_model_resolves_referenced_types():
+    common = emitters.new_model(enums=[{"Gear_enum": {0: "Park", 1: "Park"}}])
+    local = emitters.new_model(buses=[("Bus", [{"Name": "Gear", "DataType": "Enum: Gear_enum", "Dimensions": 1}])])
+    assert validate.validate_model(local) == [("bus element", "Bus.Gear", "unknown DataType 'Enum: Gear_enum'")]
+    # The referenced enum resolves the type, its own errors belong to the referenced dictionary
+    assert validate.validate_model(local, [common]) == []